@@ -5,8 +5,9 @@
 and other Emotiva devices using the Emotiva control protocol.
 """
 
-from .controller import EmotivaController
-from .enums import Command, Property, Input, Zone
+from importlib import import_module
+from typing import Any
+
 from .exceptions import (
     EmotivaError,
     AckTimeoutError,
@@ -25,4 +26,39 @@
     "AckTimeoutError",
     "InvalidArgumentError",
     "setup_logging",
+    "fast_loop_factory",
 ]
+
+# The controller pulls in asyncio and the whole transport stack, which is most
+# of this package's import time, and the enums are a ~230-member catalog that
+# the core transport modules never use. Both are resolved on first attribute
+# access (PEP 562), so a discovery-only client importing ``pymotivaxmc2.core``
+# pays for neither. ``fast_loop_factory`` imports asyncio, so it is lazy too.
+# Static types for these names come from ``__init__.pyi``.
+_LAZY_EXPORTS = {
+    "EmotivaController": ".controller",
+    "Command": ".enums",
+    "Property": ".enums",
+    "Input": ".enums",
+    "Zone": ".enums",
+    "fast_loop_factory": ".core.eventloop",
+}
+# Declared only; each is bound by __getattr__ on first access.
+EmotivaController: Any
+Command: Any
+Property: Any
+Input: Any
+Zone: Any
+fast_loop_factory: Any
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
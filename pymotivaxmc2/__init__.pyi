@@ -0,0 +1,16 @@
+# Type stub for the package root: ``__init__.py`` resolves EmotivaController
+# lazily (PEP 562), so the explicit re-exports live here for type checkers.
+# Keep this list in step with ``__all__`` in ``__init__.py``.
+
+from .controller import EmotivaController as EmotivaController
+from .enums import Command as Command, Property as Property, Input as Input, Zone as Zone
+from .exceptions import (
+    EmotivaError as EmotivaError,
+    AckTimeoutError as AckTimeoutError,
+    InvalidArgumentError as InvalidArgumentError,
+)
+from .core.logging import setup_logging as setup_logging
+from .core.eventloop import fast_loop_factory as fast_loop_factory
+
+__version__: str
+__all__: list[str]
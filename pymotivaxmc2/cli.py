@@ -37,8 +37,10 @@
 
 import argparse
 import asyncio
+import re
 import sys
-from typing import Sequence
+from types import MappingProxyType
+from typing import Awaitable, Callable, Mapping, Sequence
 import logging
 from pymotivaxmc2 import (
     EmotivaController,
@@ -48,6 +50,7 @@
     Zone,
     AckTimeoutError,
     InvalidArgumentError,
+    fast_loop_factory,
     setup_logging,
 )
 
@@ -58,6 +61,12 @@
 # Argument parsing helpers
 # ---------------------------------------------------------------------------
 
+# Shared by every on/off/toggle subcommand and by fast_parse(); built once.
+# The tuple keeps argparse's choice order; the frozenset is for membership.
+_SWITCH_ACTIONS = ("on", "off", "toggle")
+_SWITCH_ACTION_SET = frozenset(_SWITCH_ACTIONS)
+
+
 def positive_float(value: str) -> float:
     try:
         f = float(value)
@@ -66,21 +75,11 @@ def positive_float(value: str) -> float:
     return f
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        prog="emu-cli",
-        description="Command‑line controller for Emotiva processors",
-    )
-    parser.add_argument("--host", required=True, help="IP address or hostname of the device")
-
-    sub = parser.add_subparsers(dest="cmd", required=True)
+def _add_power(power: argparse.ArgumentParser) -> None:
+    power.add_argument("action", choices=_SWITCH_ACTIONS)
 
-    # ---- power ------------------------------------------------------------
-    power = sub.add_parser("power", help="Main‑zone power control")
-    power.add_argument("action", choices=["on", "off", "toggle"])
 
-    # ---- volume -----------------------------------------------------------
-    volume = sub.add_parser("volume", help="Main‑zone volume control")
+def _add_volume(volume: argparse.ArgumentParser) -> None:
     vol_sub = volume.add_subparsers(dest="action", required=True)
 
     up = vol_sub.add_parser("up", help="Volume +step dB (default 1)")
@@ -92,27 +91,27 @@ def build_parser() -> argparse.ArgumentParser:
     set_ = vol_sub.add_parser("set", help="Set absolute volume in dB")
     set_.add_argument("value", type=float)
 
-    # ---- mute -------------------------------------------------------------
-    mute = sub.add_parser("mute", help="Main‑zone mute control")
-    mute.add_argument("action", choices=["on", "off", "toggle"])
 
-    # ---- input ------------------------------------------------------------
-    inp = sub.add_parser("input", help="Main‑zone input selection")
+def _add_mute(mute: argparse.ArgumentParser) -> None:
+    mute.add_argument("action", choices=_SWITCH_ACTIONS)
+
+
+def _add_input(inp: argparse.ArgumentParser) -> None:
     inp_sub = inp.add_subparsers(dest="action", required=True)
     set_in = inp_sub.add_parser("set", help="Select input")
     set_in.add_argument("name", help="input name, e.g. hdmi1, coax2, usb…")
 
-    # ---- status -----------------------------------------------------------
-    status = sub.add_parser("status", help="Query property values")
+
+def _add_status(status: argparse.ArgumentParser) -> None:
     status.add_argument("properties", nargs="+", help="property names (power, volume, …)")
 
-    # ---- zone 2 -----------------------------------------------------------
-    z2 = sub.add_parser("zone2", help="Zone‑2 commands")
+
+def _add_zone2(z2: argparse.ArgumentParser) -> None:
     z2_sub = z2.add_subparsers(dest="z2cmd", required=True)
 
     # zone2 power
     z2_pow = z2_sub.add_parser("power", help="Zone‑2 power control")
-    z2_pow.add_argument("action", choices=["on", "off", "toggle"])
+    z2_pow.add_argument("action", choices=_SWITCH_ACTIONS)
 
     # zone2 volume
     z2_vol = z2_sub.add_parser("volume", help="Zone‑2 volume control")
@@ -124,19 +123,140 @@ def build_parser() -> argparse.ArgumentParser:
     z2_set = z2_vol_sub.add_parser("set")
     z2_set.add_argument("value", type=float)
 
+
+# Subcommand -> (help, argument-tree builder), in --help listing order.
+_SUBCOMMANDS: Mapping[str, tuple[str, Callable[[argparse.ArgumentParser], None]]] = MappingProxyType({
+    "power": ("Main‑zone power control", _add_power),
+    "volume": ("Main‑zone volume control", _add_volume),
+    "mute": ("Main‑zone mute control", _add_mute),
+    "input": ("Main‑zone input selection", _add_input),
+    "status": ("Query property values", _add_status),
+    "zone2": ("Zone‑2 commands", _add_zone2),
+})
+
+
+def _subcommand(argv: Sequence[str]) -> str | None:
+    """Return the subcommand ``argv`` invokes, or ``None`` if it is unclear.
+
+    The first positional is the subcommand. ``--host`` and the prefixes
+    argparse accepts for it (``--ho``, ...) are followed by a value that is
+    skipped. A first positional that is not a known subcommand yields
+    ``None``.
+    """
+    tokens = iter(argv)
+    for token in tokens:
+        if len(token) > 2 and "--host".startswith(token):
+            next(tokens, None)  # skip the option's value
+        elif not token.startswith("-"):
+            return token if token in _SUBCOMMANDS else None
+    return None
+
+
+def build_parser(argv: Sequence[str] | None = None) -> argparse.ArgumentParser:
+    """Build the ``emu-cli`` argument parser.
+
+    Args:
+        argv: The tokens about to be parsed. When they name a known
+            subcommand, only that one gets its full argument tree; the rest
+            are registered bare (name and help — all the top-level
+            ``--help`` listing needs). ``None``, or tokens whose subcommand
+            cannot be told, builds the complete tree.
+    """
+    parser = argparse.ArgumentParser(
+        prog="emu-cli",
+        description="Command‑line controller for Emotiva processors",
+    )
+    parser.add_argument("--host", required=True, help="IP address or hostname of the device")
+
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    wanted = None if argv is None else _subcommand(argv)
+    for name, (help_text, add_arguments) in _SUBCOMMANDS.items():
+        command = sub.add_parser(name, help=help_text)
+        if wanted is None or name == wanted:
+            add_arguments(command)
+
     return parser
 
+
+# argparse accepts a leading "-" in a value only when it looks like a
+# negative number; anything else is an option and must go through argparse.
+_NEGATIVE_NUMBER = re.compile(r"-\d+|-\d*\.\d+")
+
+
+def _number(token: str) -> float | None:
+    if token.startswith("-") and not _NEGATIVE_NUMBER.fullmatch(token):
+        return None
+    try:
+        return float(token)
+    except ValueError:
+        return None
+
+
+def fast_parse(tokens: Sequence[str]) -> argparse.Namespace | None:
+    """Parse the common one-shot command shapes without building a parser.
+
+    Covers ``--host HOST`` followed by ``power``/``mute`` actions,
+    ``volume up|down [--step N]``, ``volume set DB``, ``input set NAME`` and
+    ``status PROP...``, producing the namespace :func:`build_parser` would.
+    Anything else — help, ``zone2``, option spellings such as ``--host=``,
+    malformed input — returns ``None`` so argparse parses it and reports
+    errors as usual.
+    """
+    if len(tokens) < 4 or tokens[0] != "--host" or tokens[1].startswith("-"):
+        return None
+    host, cmd, rest = tokens[1], tokens[2], list(tokens[3:])
+    args = argparse.Namespace(host=host, cmd=cmd)
+
+    # Set literals in membership tests compile to frozenset constants
+    if cmd in {"power", "mute"}:
+        if len(rest) != 1 or rest[0] not in _SWITCH_ACTION_SET:
+            return None
+        args.action = rest[0]
+    elif cmd == "volume":
+        action = rest[0]
+        if action in {"up", "down"}:
+            if len(rest) == 1:
+                step = 1.0
+            elif len(rest) == 3 and rest[1] == "--step":
+                step = _number(rest[2])
+            else:
+                return None
+            if step is None:
+                return None
+            args.action, args.step = action, step
+        elif action == "set" and len(rest) == 2:
+            value = _number(rest[1])
+            if value is None:
+                return None
+            args.action, args.value = action, value
+        else:
+            return None
+    elif cmd == "input":
+        if len(rest) != 2 or rest[0] != "set" or rest[1].startswith("-"):
+            return None
+        args.action, args.name = "set", rest[1]
+    elif cmd == "status":
+        if any(t.startswith("-") for t in rest):
+            return None
+        args.properties = rest
+    else:
+        return None
+    return args
+
 # ---------------------------------------------------------------------------
 # High‑level action dispatch helpers
 # ---------------------------------------------------------------------------
 
+# on/off/toggle action -> controller method, resolved with one dict lookup.
+# The module's lookup tables are read-only views: importers cannot alter them.
+_POWER_METHODS: Mapping[str, str] = MappingProxyType(
+    {"on": "power_on", "off": "power_off", "toggle": "power_toggle"})
+_MUTE_METHODS: Mapping[str, str] = MappingProxyType(
+    {"on": "mute_on", "off": "mute_off", "toggle": "mute_toggle"})
+
+
 async def do_power(ctrl: EmotivaController, action: str, zone: Zone):
-    if action == "on":
-        await ctrl.power_on(zone=zone)
-    elif action == "off":
-        await ctrl.power_off(zone=zone)
-    else:
-        await ctrl.power_toggle(zone=zone)
+    await getattr(ctrl, _POWER_METHODS[action])(zone=zone)
 
 
 async def do_volume(ctrl: EmotivaController, action: str, zone: Zone, **kwargs):
@@ -149,12 +269,7 @@ async def do_volume(ctrl: EmotivaController, action: str, zone: Zone, **kwargs):
 
 
 async def do_mute(ctrl: EmotivaController, action: str, zone: Zone):
-    if action == "on":
-        await ctrl.mute_on(zone=zone)
-    elif action == "off":
-        await ctrl.mute_off(zone=zone)
-    else:
-        await ctrl.mute_toggle(zone=zone)
+    await getattr(ctrl, _MUTE_METHODS[action])(zone=zone)
 
 
 async def do_input(ctrl: EmotivaController, name: str):
@@ -174,44 +289,58 @@ async def do_status(ctrl: EmotivaController, names: Sequence[str]):
             print(f"Unknown property '{n}'", file=sys.stderr)
             sys.exit(1)
     values = await ctrl.status(*props)
-    for p, v in values.items():
-        print(f"{p.name.lower():<15}: {v}")
+    # One write for the whole table rather than a print() per property
+    sys.stdout.write("".join(f"{p.name.lower():<15}: {v}\n" for p, v in values.items()))
 
 
+# ---------------------------------------------------------------------------
+# Command table
+# ---------------------------------------------------------------------------
+
+Handler = Callable[[EmotivaController, argparse.Namespace], Awaitable[None]]
+
+
+def _volume_kwargs(args: argparse.Namespace) -> dict:
+    # Everything but 'action', which do_volume takes positionally
+    return {k: v for k, v in vars(args).items() if k != "action"}
+
+
+_ZONE2_COMMANDS: Mapping[str, Handler] = MappingProxyType({
+    "power": lambda ctrl, args: do_power(ctrl, args.action, Zone.ZONE2),
+    "volume": lambda ctrl, args: do_volume(ctrl, args.action, Zone.ZONE2, **_volume_kwargs(args)),
+})
+
+# Parsed command name -> handler; one dict lookup per invocation.
+_COMMANDS: Mapping[str, Handler] = MappingProxyType({
+    "power": lambda ctrl, args: do_power(ctrl, args.action, Zone.MAIN),
+    "volume": lambda ctrl, args: do_volume(ctrl, args.action, Zone.MAIN, **_volume_kwargs(args)),
+    "mute": lambda ctrl, args: do_mute(ctrl, args.action, Zone.MAIN),
+    "input": lambda ctrl, args: do_input(ctrl, args.name),
+    "status": lambda ctrl, args: do_status(ctrl, args.properties),
+    "zone2": lambda ctrl, args: _ZONE2_COMMANDS[args.z2cmd](ctrl, args),
+})
+
 # ---------------------------------------------------------------------------
 # Main async entry
 # ---------------------------------------------------------------------------
 
 async def main(argv: Sequence[str] | None = None):
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    tokens = sys.argv[1:] if argv is None else list(argv)
+    # Hot commands skip argparse entirely; everything else (including
+    # --help and every error) goes through the real parser.
+    args = fast_parse(tokens)
+    if args is None:
+        args = build_parser(tokens).parse_args(tokens)
 
     ctrl = EmotivaController(args.host)
     try:
         await ctrl.connect()
         print(f"Connection OK")
 
-        if args.cmd == "power":
-            await do_power(ctrl, args.action, Zone.MAIN)
-        elif args.cmd == "volume":
-            # Create filtered kwargs that exclude 'action' to avoid parameter conflict
-            filtered_kwargs = {k: v for k, v in vars(args).items() if k != 'action'}
-            await do_volume(ctrl, args.action, Zone.MAIN, **filtered_kwargs)
-        elif args.cmd == "mute":
-            await do_mute(ctrl, args.action, Zone.MAIN)
-        elif args.cmd == "input":
-            await do_input(ctrl, args.name)
-        elif args.cmd == "status":
-            await do_status(ctrl, args.properties)
-        elif args.cmd == "zone2":
-            if args.z2cmd == "power":
-                await do_power(ctrl, args.action, Zone.ZONE2)
-            elif args.z2cmd == "volume":
-                # Create filtered kwargs that exclude 'action' to avoid parameter conflict
-                filtered_kwargs = {k: v for k, v in vars(args).items() if k != 'action'}
-                await do_volume(ctrl, args.action, Zone.ZONE2, **filtered_kwargs)
-        else:
-            parser.error("Invalid command")
+        handler = _COMMANDS.get(args.cmd)
+        if handler is None:
+            build_parser().error("Invalid command")
+        await handler(ctrl, args)
 
     except AckTimeoutError as exc:
         print(f"Error: {exc}", file=sys.stderr)
@@ -229,5 +358,15 @@ async def main(argv: Sequence[str] | None = None):
         await ctrl.disconnect()
 
 
+def run(argv: Sequence[str] | None = None) -> None:
+    """Console-script entry point: run :func:`main` on an event loop.
+
+    Uses uvloop's loop (winloop on Windows) when it is installed (``pip
+    install "pymotivaxmc2[uvloop]"``), the stock asyncio loop otherwise.
+    """
+    with asyncio.Runner(loop_factory=fast_loop_factory()) as runner:
+        runner.run(main(argv))
+
+
 if __name__ == "__main__":  # pragma: no cover
-    asyncio.run(main())
+    run()
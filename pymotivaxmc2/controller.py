@@ -3,8 +3,15 @@
 
 import asyncio
 import contextlib
-from typing import Callable, Awaitable, Dict, Any, Sequence, List
-from .core.discovery import Discovery
+from types import MappingProxyType
+from typing import Callable, Awaitable, Dict, Any, Mapping, Self, Sequence, List
+from .core.constants import (
+    DEFAULT_CONTROL_PORT,
+    DEFAULT_NOTIFY_PORT,
+    DEFAULT_PROTOCOL_VERSION,
+    MAX_PROTOCOL_VERSION,
+)
+from .core.discovery import Discovery, resolve_host
 from .core.socket_mgr import SocketManager
 from .core.protocol import Protocol
 from .core.dispatcher import Dispatcher
@@ -16,6 +23,27 @@
 # Module logger
 _LOGGER = get_logger("controller")
 
+# Every physical connector has a same-named select command (Input.HDMI1 ->
+# Command.HDMI1). One table keyed by connector name serves both call forms:
+# a str is looked up after lower(), and an Input member (a StrEnum, so it
+# hashes and compares as its value) is looked up directly. select_input() is
+# one dict hit, with no enum scan, KeyError probe or second table. Like the
+# tables below, it is a read-only view so no importer can mutate it.
+_INPUT_COMMANDS: Mapping[str, Command] = MappingProxyType({i.value: Command[i.name] for i in Input})
+
+# Logical sources ("Input N" buttons) 1-8 -> their source_N command, so
+# select_source() does a dict hit instead of formatting a member name and
+# looking it up through the Enum metaclass on every call.
+_SOURCE_COMMANDS: Mapping[int, Command] = MappingProxyType(
+    {n: Command[f"SOURCE_{n}"] for n in range(1, 9)})
+
+# The Input Button name properties, in button order (input_1 .. input_8).
+_INPUT_BUTTON_NAMES: tuple[str, ...] = (
+    Property.INPUT_1.value, Property.INPUT_2.value, Property.INPUT_3.value,
+    Property.INPUT_4.value, Property.INPUT_5.value, Property.INPUT_6.value,
+    Property.INPUT_7.value, Property.INPUT_8.value,
+)
+
 class EmotivaController:
     """Async facade for Emotiva devices.
 
@@ -32,17 +60,23 @@ class EmotivaController:
             (0 = unpaced). Emotiva processors have limited processing power;
             pace all control traffic with one knob when driving fragile
             firmware.
+        changes_only: Deliver a property to ``on()`` callbacks only when its
+            value differs from the last one seen (subscribe-time or notified);
+            repeats of an unchanged value are dropped before dispatch.
     """
-    def __init__(self, host: str, *, timeout: float = 5.0, protocol_max: str = "3.1",
+    def __init__(self, host: str, *, timeout: float = 5.0, protocol_max: str = MAX_PROTOCOL_VERSION,
                  ack_timeout: float = 2.0, max_retries: int = 3,
-                 min_send_interval: float = 0.0):
+                 min_send_interval: float = 0.0, changes_only: bool = False):
         self.host = host
         self.timeout = timeout
         self.protocol_max = protocol_max
         self.ack_timeout = ack_timeout
         self.max_retries = max_retries
         self.min_send_interval = min_send_interval
+        self.changes_only = changes_only
         self._info: Dict[str, Any] | None = None
+        # IP address of ``host``, resolved by connect() alongside ``_info``
+        self._address: str | None = None
         self._socket_mgr: SocketManager | None = None
         self._protocol: Protocol | None = None
         self._dispatcher: Dispatcher | None = None
@@ -82,8 +116,15 @@ def _disp(self) -> Dispatcher:
         return self._dispatcher
 
     # ---------- connection -------------------------------------------------
-    async def connect(self):
-        """Discover device, bind sockets, start dispatcher."""
+    async def connect(self, *, rediscover: bool = True):
+        """Discover device, bind sockets, start dispatcher.
+
+        Args:
+            rediscover: When ``False`` and an earlier ``connect()`` already
+                fetched the device's transponder, reuse it instead of repeating
+                the discovery round-trip (a fast reconnect). The default
+                re-runs discovery, which doubles as a liveness check.
+        """
         # Phase 1 Fix: Protect against concurrent connect() calls
         async with self._connection_lock:
             if self._connected:
@@ -91,16 +132,20 @@ async def connect(self):
                 return
                 
             _LOGGER.info("Connecting to device at %s", self.host)
-            disc = Discovery(self.host, timeout=self.timeout)
-            try:
-                self._info = await disc.fetch_transponder()
-                _LOGGER.debug("Device transponder info: %s", self._info)
-            except Exception as e:
-                _LOGGER.error("Failed to discover device: %s", e)
-                raise
+            if self._info is not None and self._address is not None and not rediscover:
+                _LOGGER.debug("Reusing cached transponder info: %s", self._info)
+            else:
+                try:
+                    self._address = await resolve_host(self.host)
+                    disc = Discovery(self._address, timeout=self.timeout)
+                    self._info = await disc.fetch_transponder()
+                    _LOGGER.debug("Device transponder info: %s", self._info)
+                except Exception as e:
+                    _LOGGER.error("Failed to discover device: %s", e)
+                    raise
 
             # Get protocol version from discovery response
-            device_protocol_version = self._info.get("protocolVersion", "2.0")
+            device_protocol_version = self._info.get("protocolVersion", DEFAULT_PROTOCOL_VERSION)
             
             # Use the lower of the device's supported version and our max supported version
             if self.protocol_max < device_protocol_version:
@@ -112,14 +157,15 @@ async def connect(self):
                 _LOGGER.info("Using protocol version %s", protocol_version)
 
             ports = {
-                "controlPort": self._info.get("controlPort", 7002),
-                "notifyPort": self._info.get("notifyPort", 7003),
-                "menuNotifyPort": self._info.get("menuNotifyPort", self._info.get("notifyPort", 7003)),
+                "controlPort": self._info.get("controlPort", DEFAULT_CONTROL_PORT),
+                "notifyPort": self._info.get("notifyPort", DEFAULT_NOTIFY_PORT),
+                "menuNotifyPort": self._info.get("menuNotifyPort",
+                                                 self._info.get("notifyPort", DEFAULT_NOTIFY_PORT)),
             }
             _LOGGER.info("Using ports: %s", ports)
             
             try:
-                self._socket_mgr = SocketManager(self.host, ports)
+                self._socket_mgr = SocketManager(self._address, ports)
                 await self._socket_mgr.start()
                 _LOGGER.debug("Socket manager started")
             except Exception as e:
@@ -134,7 +180,8 @@ async def connect(self):
                                           ack_timeout=self.ack_timeout,
                                           max_retries=self.max_retries,
                                           min_send_interval=self.min_send_interval)
-                self._dispatcher = Dispatcher(self._socket_mgr, "notifyPort")
+                self._dispatcher = Dispatcher(self._socket_mgr, "notifyPort",
+                                              changes_only=self.changes_only)
                 # Let the protocol fan subscribe-time initial values out through
                 # the dispatcher's callback path (see Protocol.subscribe).
                 self._protocol.dispatcher = self._dispatcher
@@ -197,6 +244,15 @@ async def disconnect(self):
                 self._protocol = None
                 self._dispatcher = None
 
+    async def __aenter__(self) -> Self:
+        """``async with EmotivaController(host) as ctrl:`` connects on entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Disconnect on exit, however the block ends."""
+        await self.disconnect()
+
     # ---------- device info accessors ---------------------------------------
     @property
     def keepalive_interval_ms(self) -> int | None:
@@ -210,8 +266,8 @@ def keepalive_interval_ms(self) -> int | None:
         """
         if self._info is None:
             return None
-        ka = self._info.get("keepAlive")
-        return int(ka) if ka is not None else None
+        # Discovery stores the interval as an int (milliseconds) already.
+        return self._info.get("keepAlive")
 
     @property
     def notification_sequence(self) -> int | None:
@@ -275,11 +331,15 @@ async def unsubscribe(self, props: Property | Sequence[Property]):
             _LOGGER.error("Failed to unsubscribe from properties: %s", e)
             raise
 
-    def on(self, prop: Property):
-        """Register a callback for property changes."""
+    def on(self, prop: Property, *, inline: bool = False):
+        """Register a callback for property changes.
+
+        ``inline=True`` marks a plain ``def`` callback as non-blocking, so it
+        is called directly on the event loop instead of in a thread-pool job.
+        """
         def decorator(cb: Callable[[Any], Awaitable[None]] | Callable[[Any], None]):
             _LOGGER.debug("Registering callback for property: %s", prop.value)
-            self._disp.on(prop.value, cb)
+            self._disp.on(prop.value, cb, inline=inline)
             return cb
         return decorator
 
@@ -364,23 +424,13 @@ async def mute_off(self, *, zone: Zone = Zone.MAIN,
     async def select_input(self, input: Input | str, *,
                            retries: int | None = None, ack: bool = True):
         """Select an input source."""
-        if isinstance(input, Input):
-            input_value = input.value
-            input_name = input.name
-        else:
-            input_value = input.lower()
-            input_name = input_value.upper()
-            if input_value not in (i.value for i in Input):
-                _LOGGER.error("Invalid input: %s", input)
-                raise InvalidArgumentError(f"Unknown input {input}")
-                
-        _LOGGER.info("Selecting input: %s", input_name)
-        try:
-            await self._proto.send_command(Command[f"{input_value.upper()}"].value,
-                                           retries=retries, ack=ack)
-        except KeyError:
-            _LOGGER.error("Command not found for input: %s", input_value)
-            raise InvalidArgumentError(f"Command not found for input {input_value}")
+        cmd = _INPUT_COMMANDS.get(input if isinstance(input, Input) else input.lower())
+        if cmd is None:
+            _LOGGER.error("Invalid input: %s", input)
+            raise InvalidArgumentError(f"Unknown input {input}")
+
+        _LOGGER.info("Selecting input: %s", cmd.name)
+        await self._proto.send_command(cmd.value, retries=retries, ack=ack)
 
     async def select_source(self, source: int | str, *,
                             retries: int | None = None, ack: bool = True):
@@ -411,8 +461,8 @@ async def select_source(self, source: int | str, *,
         elif isinstance(source, bool):
             # bool is a subclass of int; reject explicitly to avoid True -> source_1
             raise InvalidArgumentError(f"Invalid source: {source!r}")
-        elif isinstance(source, int) and 1 <= source <= 8:
-            cmd = Command[f"SOURCE_{source}"]
+        elif isinstance(source, int) and source in _SOURCE_COMMANDS:
+            cmd = _SOURCE_COMMANDS[source]
             label = f"Input {source}"
         else:
             _LOGGER.error("Invalid source: %r", source)
@@ -439,12 +489,11 @@ async def get_input_names(self, *, timeout: float = 2.0,
             ``{1: {"name": "ZAPPITI", "visible": True}, ...}``. Buttons the
             device does not report are omitted.
         """
-        names = [Property[f"INPUT_{i}"].value for i in range(1, 9)]
+        names = list(_INPUT_BUTTON_NAMES)
         _LOGGER.info("Requesting input button names: %s (timeout=%.1f)", names, timeout)
         result = await self._proto.request_properties_full(names, timeout=timeout, retries=retries)
         out: Dict[int, Dict[str, Any]] = {}
-        for i in range(1, 9):
-            key = f"input_{i}"
+        for i, key in enumerate(_INPUT_BUTTON_NAMES, 1):
             if key in result:
                 out[i] = {"name": result[key]["value"], "visible": result[key]["visible"]}
         return out
@@ -462,7 +511,10 @@ async def status(self, *props: Property, timeout: float = 2.0,
         
         try:
             result = await self._proto.request_properties(names, timeout=timeout, retries=retries)
-            return {Property(name): val for name, val in result.items()}
+            # Map replies back to the caller's own members: a dict hit per
+            # name instead of an Enum value lookup through the metaclass.
+            members = dict(zip(names, props))
+            return {members[name]: val for name, val in result.items()}
         except Exception as e:
             _LOGGER.error("Error fetching status: %s", e)
             raise
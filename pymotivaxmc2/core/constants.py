@@ -0,0 +1,18 @@
+"""Wire-protocol constants shared by the discovery, protocol and facade layers."""
+from typing import Final
+
+# Discovery: the ping goes to 7000 and the transponder answers on 7001.
+DISCOVERY_PORT: Final[int] = 7000
+TRANSPONDER_PORT: Final[int] = 7001
+
+# Control / notify ports used when the transponder does not advertise its own.
+DEFAULT_CONTROL_PORT: Final[int] = 7002
+DEFAULT_NOTIFY_PORT: Final[int] = 7003
+
+# Protocol assumed when the transponder reports no version.
+DEFAULT_PROTOCOL_VERSION: Final[str] = "2.0"
+# First version whose frames carry <property name="..."> elements instead of
+# one element per property name.
+NAMED_PROPERTIES_VERSION: Final[str] = "3.0"
+# Newest protocol this library speaks (sent in the ping, and the default cap).
+MAX_PROTOCOL_VERSION: Final[str] = "3.1"
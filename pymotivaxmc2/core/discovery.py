@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import random
+import socket
 from xml.etree import ElementTree as ET
-from typing import Dict, Any
+from typing import Dict, Any, Final
 
+from .constants import DEFAULT_PROTOCOL_VERSION, DISCOVERY_PORT, MAX_PROTOCOL_VERSION, TRANSPONDER_PORT
 from .logging import get_logger, log_xml
 
 # Module logger
@@ -15,7 +18,54 @@ class DiscoveryError(Exception):
     ...
 
 # Updated to use protocol attribute instead of version as per the spec
-PING_XML = b"""<?xml version="1.0" encoding="utf-8"?><emotivaPing protocol="3.1"/>"""
+PING_XML: Final[bytes] = (
+    f'<?xml version="1.0" encoding="utf-8"?><emotivaPing protocol="{MAX_PROTOCOL_VERSION}"/>'
+).encode()
+
+async def resolve_host(host: str) -> str:
+    """Return the IPv4 address of ``host``.
+
+    IP literals come back unchanged without touching the resolver. A hostname
+    is looked up once here so discovery and every later send use the address
+    directly: ``sendto`` with a hostname resolves it again (synchronously) per
+    datagram, and the transponder reply is matched on the sender's IP.
+
+    Raises:
+        DiscoveryError: if the hostname cannot be resolved.
+    """
+    try:
+        socket.inet_pton(socket.AF_INET, host)
+        return host
+    except OSError:
+        pass
+    loop = asyncio.get_running_loop()
+    try:
+        infos = await loop.getaddrinfo(host, None, family=socket.AF_INET,
+                                       type=socket.SOCK_DGRAM)
+    except OSError as e:
+        raise DiscoveryError(f"Cannot resolve host {host!r}: {e}") from e
+    address = str(infos[0][4][0])
+    _LOGGER.debug("Resolved %s to %s", host, address)
+    return address
+
+class _TransponderProto(asyncio.DatagramProtocol):
+    """Queues transponder replies that come from the device being discovered."""
+
+    # Defined once at module level rather than per fetch_transponder() call;
+    # slotted like socket_mgr's protocol, as asyncio's protocol bases are.
+    __slots__ = ("host", "replies")
+
+    def __init__(self, host: str, replies: asyncio.Queue[bytes]):
+        self.host = host
+        self.replies = replies
+
+    def datagram_received(self, data, addr):
+        if addr[0] == self.host:
+            _LOGGER.debug("Received %d bytes from %s:%d", len(data), addr[0], addr[1])
+            log_xml(_LOGGER, "received", data)
+            self.replies.put_nowait(data)
+        else:
+            _LOGGER.warning("Received data from unexpected source %s (expected %s)", addr[0], self.host)
 
 class Discovery:
     def __init__(self, host: str, *, timeout: float = 5.0):
@@ -30,89 +80,94 @@ def __init__(self, host: str, *, timeout: float = 5.0):
                     host, timeout, self._max_retries)
 
     async def fetch_transponder(self) -> Dict[str, Any]:
-        """Send ping to port 7000 and wait for transponder on 7001 with retry logic."""
+        """Send ping to port 7000 and wait for transponder on 7001 with retry logic.
+
+        The transponder listener stays bound across attempts and through the backoff
+        between them, so a reply to an earlier ping that arrives late still
+        completes discovery instead of being dropped with its socket.
+        """
         _LOGGER.info("Discovering device at %s", self.host)
-        
+
+        loop = asyncio.get_running_loop()
+        replies: asyncio.Queue[bytes] = asyncio.Queue()
+
         # Phase 2 Fix: Implement retry logic with exponential backoff
         last_exception = None
-        for attempt in range(self._max_retries):
-            try:
-                # Calculate adaptive timeout
-                adaptive_timeout = self.timeout
-                if attempt > 0:
-                    adaptive_timeout = self.timeout * (1.2 ** attempt)  # Modest increase
-                    _LOGGER.debug("Discovery retry %d with timeout %.2f", attempt + 1, adaptive_timeout)
-                
-                loop = asyncio.get_running_loop()
-                recv_fut = loop.create_future()
-                host = self.host  # Store host locally for _Proto to access
-
-                class _Proto(asyncio.DatagramProtocol):
-                    def datagram_received(self, data, addr):
-                        if addr[0] == host:  # Use the host from outer scope
-                            _LOGGER.debug("Received %d bytes from %s:%d", len(data), addr[0], addr[1])
-                            log_xml(_LOGGER, "received", data)
-                            recv_fut.set_result(data)
-                        else:
-                            _LOGGER.warning("Received data from unexpected source %s (expected %s)", addr[0], host)
-
-                transport = None
+        transport = None
+        try:
+            for attempt in range(self._max_retries):
                 try:
-                    _LOGGER.debug("Binding to port 7001 for transponder response (attempt %d)", attempt + 1)
-                    transport, _ = await loop.create_datagram_endpoint(
-                        lambda: _Proto(),
-                        local_addr=("0.0.0.0", 7001),
-                    )
-                    
-                    _LOGGER.debug("Sending ping to %s:7000", self.host)
+                    # Calculate adaptive timeout
+                    adaptive_timeout = self.timeout
+                    if attempt > 0:
+                        adaptive_timeout = self.timeout * (1.2 ** attempt)  # Modest increase
+                        _LOGGER.debug("Discovery retry %d with timeout %.2f", attempt + 1, adaptive_timeout)
+
+                    if transport is None:
+                        _LOGGER.debug("Binding to port %d for transponder response (attempt %d)",
+                                      TRANSPONDER_PORT, attempt + 1)
+                        transport, _ = await loop.create_datagram_endpoint(
+                            lambda: _TransponderProto(self.host, replies),
+                            local_addr=("0.0.0.0", TRANSPONDER_PORT),
+                        )
+
+                    _LOGGER.debug("Sending ping to %s:%d", self.host, DISCOVERY_PORT)
                     log_xml(_LOGGER, "sent", PING_XML)
-                    transport.sendto(PING_XML, (self.host, 7000))
+                    transport.sendto(PING_XML, (self.host, DISCOVERY_PORT))
 
                     try:
                         _LOGGER.debug("Waiting for transponder response (timeout=%.2f)", adaptive_timeout)
-                        data = await asyncio.wait_for(recv_fut, timeout=adaptive_timeout)
+                        data = await asyncio.wait_for(replies.get(), timeout=adaptive_timeout)
                         _LOGGER.info("Received transponder response from %s (attempt %d)", self.host, attempt + 1)
-                        
+
                         # Parse and return result on success
                         return self._parse_transponder_data(data)
-                        
+
                     except asyncio.TimeoutError as e:
                         last_exception = DiscoveryError(f"No transponder reply (attempt {attempt + 1})")
                         if attempt < self._max_retries - 1:
                             backoff_time = self._base_backoff * (2 ** attempt) + random.uniform(0, 0.5)
-                            _LOGGER.warning("Discovery timeout on attempt %d, retrying in %.2f seconds", 
+                            _LOGGER.warning("Discovery timeout on attempt %d, retrying in %.2f seconds",
                                           attempt + 1, backoff_time)
-                            await asyncio.sleep(backoff_time)
+                            # Keep listening through the backoff: a late reply
+                            # to this ping ends discovery without another one.
+                            try:
+                                data = await asyncio.wait_for(replies.get(), timeout=backoff_time)
+                            except asyncio.TimeoutError:
+                                continue
+                            _LOGGER.info("Received late transponder response from %s (attempt %d)",
+                                         self.host, attempt + 1)
+                            return self._parse_transponder_data(data)
                         else:
-                            _LOGGER.error("No transponder reply from %s after %d attempts", 
+                            _LOGGER.error("No transponder reply from %s after %d attempts",
                                         self.host, self._max_retries)
-                finally:
-                    if transport:
-                        transport.close()
-                        
-            except OSError as e:
-                # Handle port binding issues
-                last_exception = DiscoveryError(f"Network error during discovery (attempt {attempt + 1}): {e}")
-                if attempt < self._max_retries - 1:
-                    backoff_time = self._base_backoff * (attempt + 1) + random.uniform(0, 0.3)
-                    _LOGGER.warning("Discovery network error on attempt %d: %s, retrying in %.2f seconds", 
-                                  attempt + 1, e, backoff_time)
-                    await asyncio.sleep(backoff_time)
-                else:
-                    _LOGGER.error("Discovery failed after %d attempts due to network error: %s", 
-                                self._max_retries, e)
-            except Exception as e:
-                # Handle other unexpected errors
-                last_exception = DiscoveryError(f"Unexpected error during discovery (attempt {attempt + 1}): {e}")
-                if attempt < self._max_retries - 1:
-                    backoff_time = self._base_backoff * (attempt + 1)
-                    _LOGGER.warning("Discovery unexpected error on attempt %d: %s, retrying in %.2f seconds", 
-                                  attempt + 1, e, backoff_time)
-                    await asyncio.sleep(backoff_time)
-                else:
-                    _LOGGER.error("Discovery failed after %d attempts due to unexpected error: %s", 
-                                self._max_retries, e)
-        
+
+                except OSError as e:
+                    # Handle port binding issues
+                    last_exception = DiscoveryError(f"Network error during discovery (attempt {attempt + 1}): {e}")
+                    if attempt < self._max_retries - 1:
+                        backoff_time = self._base_backoff * (attempt + 1) + random.uniform(0, 0.3)
+                        _LOGGER.warning("Discovery network error on attempt %d: %s, retrying in %.2f seconds",
+                                      attempt + 1, e, backoff_time)
+                        await asyncio.sleep(backoff_time)
+                    else:
+                        _LOGGER.error("Discovery failed after %d attempts due to network error: %s",
+                                    self._max_retries, e)
+                except Exception as e:
+                    # Handle other unexpected errors
+                    last_exception = DiscoveryError(f"Unexpected error during discovery (attempt {attempt + 1}): {e}")
+                    if attempt < self._max_retries - 1:
+                        backoff_time = self._base_backoff * (attempt + 1)
+                        _LOGGER.warning("Discovery unexpected error on attempt %d: %s, retrying in %.2f seconds",
+                                      attempt + 1, e, backoff_time)
+                        await asyncio.sleep(backoff_time)
+                    else:
+                        _LOGGER.error("Discovery failed after %d attempts due to unexpected error: %s",
+                                    self._max_retries, e)
+        finally:
+            if transport:
+                transport.close()
+
         # All retries exhausted
         if last_exception:
             raise last_exception
@@ -155,13 +210,15 @@ def _parse_transponder_data(self, data: bytes) -> Dict[str, Any]:
             # Default to protocol version 2.0 if not specified
             if "protocolVersion" not in info:
                 _LOGGER.warning("Protocol version not found in transponder, defaulting to 2.0")
-                info["protocolVersion"] = "2.0"
+                info["protocolVersion"] = DEFAULT_PROTOCOL_VERSION
                     
-            _LOGGER.info("Device info: model=%s, name=%s, protocol=%s, ports=%s", 
-                       info.get("model", "Unknown"), 
-                       info.get("name", "Unknown"),
-                       info.get("protocolVersion"), 
-                       {k: v for k, v in info.items() if k.endswith("Port")})
+            # The port summary is built only when it will actually be logged.
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info("Device info: model=%s, name=%s, protocol=%s, ports=%s",
+                           info.get("model", "Unknown"),
+                           info.get("name", "Unknown"),
+                           info.get("protocolVersion"),
+                           {k: v for k, v in info.items() if k.endswith("Port")})
             return info
         except ET.ParseError as e:
             _LOGGER.error("Failed to parse transponder XML: %s", e)
@@ -3,8 +3,10 @@
 
 import asyncio
 import contextlib
-from collections import defaultdict
-from typing import Callable, Awaitable, Dict, Coroutine, Any
+import logging
+import sys
+from collections import defaultdict, deque
+from typing import Callable, Awaitable, Container, Dict, Coroutine, Any, Final, Sequence
 
 from .logging import get_logger
 from .xmlcodec import parse_xml
@@ -14,17 +16,81 @@
 
 Callback = Callable[[Any], Awaitable[None]] | Callable[[Any], None]
 
+# Upper bound on async callback invocations waiting for the drain task. On
+# overflow the OLDEST pending invocation is dropped (with a warning): under a
+# notification burst the newest value is the one worth delivering.
+_MAX_PENDING_CALLBACKS: Final[int] = 1024
+
+# Root tags of notify-port frames nothing consumes yet (menu and front-panel
+# bar updates). They are recognised on the raw bytes and dropped unparsed:
+# a menu frame is the largest the device sends, and arrives on every step of
+# on-screen menu navigation.
+_UNHANDLED_ROOTS: Final = (b"<emotivaMenuNotify", b"<emotivaBarNotify")
+
+def _root_offset(data: bytes) -> int:
+    """Index of the root element's ``<`` in ``data``, past any XML declaration."""
+    start = data.find(b"<")
+    if data.startswith(b"<?", start):
+        start = data.find(b"<", data.find(b"?>", start))
+    return start
+
+# How a registered callback is invoked, resolved once in on(): awaited by the
+# drain task, batched into a thread-pool job (plain sync callbacks), or called
+# right on the loop (sync callbacks registered with inline=True).
+_RUN_IN_EXECUTOR: Final[int] = 0
+_AWAIT: Final[int] = 1
+_CALL_INLINE: Final[int] = 2
+
+# Python 3.12+ can start a task eagerly: it runs synchronously up to its first
+# real suspension and is only scheduled on the loop if it has to wait.
+_eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+
+def _start_task(coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+    """Wrap ``coro`` in a task, started eagerly where the runtime supports it."""
+    loop = asyncio.get_running_loop()
+    if _eager_task_factory is not None:
+        return _eager_task_factory(loop, coro)
+    return loop.create_task(coro)
+
+def _run_sync_callbacks(calls: list[tuple[str, Callback, str]]) -> None:
+    """Executor-side body: run a frame's sync callbacks, containing each error."""
+    for prop_name, cb, value in calls:
+        try:
+            cb(value)
+        except Exception as e:
+            _LOGGER.error("Error in callback for '%s': %s", prop_name, e)
+
 class Dispatcher:
-    def __init__(self, socket_mgr, notify_port_name: str):
+    def __init__(self, socket_mgr, notify_port_name: str, *, changes_only: bool = False):
         self.socket_mgr = socket_mgr
         self.notify_port_name = notify_port_name
+        # With changes_only, the last value seen per property (notified or
+        # subscribe-time) gates dispatch: a repeat of it reaches no callback.
+        self._changes_only = changes_only
+        self._last_values: Dict[str, str] = {}
         self._listeners: Dict[str, list[Callback]] = defaultdict(list)
+        # Compiled per-property routes: each registered callback paired with
+        # how it is invoked (_AWAIT / _RUN_IN_EXECUTOR / _CALL_INLINE),
+        # resolved once at registration so the notify loop does one dict lookup
+        # per property instead of re-classifying every callback on every event.
+        self._routes: Dict[str, tuple[tuple[Callback, int], ...]] = {}
         self._task: asyncio.Task | None = None
         
         # Phase 1 Fix: Add callback timeout protection and task management
         self._active_tasks: set[asyncio.Task] = set()
         self._callback_timeout = 5.0  # 5 second timeout for callbacks
 
+        # Async callback invocations are queued here and awaited in arrival
+        # order by ONE drain task per burst, instead of a fire-and-forget Task
+        # per callback per property (unbounded pile-up under bursts, and no
+        # ordering between successive values of the same property).
+        self._pending: deque[tuple[str, Callback, str]] = deque(maxlen=_MAX_PENDING_CALLBACKS)
+        self._drain_task: asyncio.Task | None = None
+        # True while _drain_callbacks() is running. An eagerly started drain
+        # runs before _drain_task is assigned, so a callback that dispatches
+        # re-entrantly must not start a second one.
+        self._draining = False
+
         # Notification sequence tracking (spec: emotivaNotify carries an
         # incrementing sequence attribute since protocol 2.0). A jump reveals
         # MISSED notifications — the honest alternative to a blind full
@@ -34,13 +100,33 @@ def __init__(self, socket_mgr, notify_port_name: str):
         
         _LOGGER.debug("Dispatcher initialized for port %s", notify_port_name)
 
-    def on(self, prop: str, cb: Callback):
+    def on(self, prop: str, cb: Callback, *, inline: bool = False):
+        """Register ``cb`` for ``prop``.
+
+        Sync callbacks run in a thread-pool job so a blocking one cannot stall
+        the notify loop. ``inline=True`` declares a sync callback
+        non-blocking (e.g. it only stores the value): it is then called
+        directly on the loop as the frame is dispatched, skipping the executor
+        hand-off. Async callbacks are always awaited by the drain task.
+        """
+        is_async = asyncio.iscoroutinefunction(cb)
+        if inline and is_async:
+            raise ValueError("inline=True applies to sync callbacks only")
+        # Route keys are interned once here (a name built at runtime, e.g.
+        # f"input_{i}", is otherwise a private copy). Names parsed from each
+        # frame are NOT interned: interning costs a lookup of its own, more
+        # than the equal-hash compare it would save on a short key.
+        prop = sys.intern(str(prop))
         self._listeners[prop].append(cb)
+        # Extend the compiled route with just the new callback; the ones
+        # already registered were classified when they were added.
+        kind = _AWAIT if is_async else _CALL_INLINE if inline else _RUN_IN_EXECUTOR
+        self._routes[prop] = self._routes.get(prop, ()) + ((cb, kind),)
         _LOGGER.debug("Registered callback for property '%s'", prop)
 
     def has_listeners(self, prop: str) -> bool:
         """Return True if any callback is registered for ``prop``."""
-        return bool(self._listeners.get(prop))
+        return prop in self._routes
 
     async def dispatch(self, prop: str, value: str) -> None:
         """Public entry point to dispatch a single property value to its listeners.
@@ -52,6 +138,15 @@ async def dispatch(self, prop: str, value: str) -> None:
         """
         await self._dispatch_property(prop, value)
 
+    async def dispatch_many(self, values: Dict[str, str]) -> None:
+        """Dispatch several property values to their listeners as one frame.
+
+        Same path as :meth:`dispatch`, but the values share a single fan-out
+        pass (and a single executor job for synchronous callbacks), exactly
+        like the properties of one ``emotivaNotify`` packet.
+        """
+        await self._dispatch_properties(values)
+
     async def start(self):
         _LOGGER.info("Starting notification dispatcher")
         if self._task and not self._task.done():
@@ -77,125 +172,249 @@ async def stop(self):
             # Wait for tasks to complete cancellation
             await asyncio.gather(*self._active_tasks, return_exceptions=True)
             self._active_tasks.clear()
+        self._pending.clear()
 
     def _remove_task(self, task: asyncio.Task):
         """Remove completed task from active set."""
         self._active_tasks.discard(task)
 
-    def _extract_properties(self, xml):
+    def _extract_properties(self, xml, wanted: Container[str] | None = None):
         """Extract properties from notification XML, handling both protocol formats.
-        
+
+        Args:
+            xml: The parsed notification frame.
+            wanted: If given, only properties named in it are extracted; the
+                others are skipped inside the same pass over the elements.
+
         Returns:
             dict: Property name -> value mappings extracted from the XML
         """
-        properties = {}
-        
         # Check for Protocol 3.0+ format first (property elements with name attributes)
         property_elements = xml.findall("property")
         if property_elements:
             # Protocol 3.0+ format: <property name="volume" value="-20.5" visible="true"/>
-            for prop_elem in property_elements:
-                prop_name = prop_elem.get("name")
-                if prop_name:
-                    # Prefer 'value' attribute, fall back to text content
-                    value = prop_elem.get("value", "") or prop_elem.text or ""
-                    properties[prop_name] = value
-                    _LOGGER.debug("Extracted property '%s' = '%s' (Protocol 3.0+ format)", 
-                                prop_name, value)
+            # Prefer 'value' attribute, fall back to text content
+            fmt = "3.0+"
+            properties = {
+                name: e.get("value", "") or e.text or ""
+                for e in property_elements
+                if (name := e.get("name")) and (wanted is None or name in wanted)
+            }
         else:
             # Protocol 2.0 format: direct child elements like <volume>-20.5</volume>
-            for prop_elem in xml:
-                prop_name = prop_elem.tag
-                # Prefer text content, fall back to 'value' attribute
-                value = prop_elem.text or prop_elem.get("value", "")
-                properties[prop_name] = value
-                _LOGGER.debug("Extracted property '%s' = '%s' (Protocol 2.0 format)",
-                            prop_name, value)
+            # Prefer text content, fall back to 'value' attribute
+            fmt = "2.0"
+            properties = {e.tag: e.text or e.get("value", "") for e in xml
+                          if wanted is None or e.tag in wanted}
+
+        # One level check per frame rather than one debug call per property.
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            for prop_name, value in properties.items():
+                _LOGGER.debug("Extracted property '%s' = '%s' (Protocol %s format)",
+                              prop_name, value, fmt)
         
         return properties
 
     async def _dispatch_property(self, prop_name: str, value: str):
         """Dispatch a single property notification to its listeners."""
-        listeners = self._listeners.get(prop_name, [])
-        if listeners:
-            _LOGGER.debug("Dispatching property '%s' to %d listeners", prop_name, len(listeners))
-            
-            # Phase 1 Fix: Protected callback execution with timeout and task management
-            for cb in listeners:
+        await self._dispatch_properties({prop_name: value})
+
+    async def _dispatch_properties(self, properties: Dict[str, str]) -> None:
+        """Dispatch every property of one notification frame to its listeners."""
+        await self._dispatch_frames((properties,))
+
+    async def _dispatch_frames(self, frames: Sequence[Dict[str, str]]) -> None:
+        """Dispatch the properties of one or more frames, in order, to their listeners.
+
+        Async callbacks are queued for the drain task (see
+        :meth:`_drain_callbacks`); the synchronous callbacks of ALL the frames
+        are collected and run in ONE executor job rather than one executor
+        round-trip per frame, per callback or per property.
+        """
+        pending = self._pending
+        queue_call = pending.append
+        get_route = self._routes.get
+        sync_calls: list[tuple[str, Callback, str]] = []
+        add_sync_call = sync_calls.append
+        # The level check is the same for every property in the batch; test it
+        # once here rather than inside two debug() calls per property.
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        last_values = self._last_values if self._changes_only else None
+        # Overflow is counted and reported once per call: a warning per
+        # dropped invocation would flood the log exactly during a burst.
+        dropped = 0
+        for properties in frames:
+            for prop_name, value in properties.items():
+                if last_values is not None:
+                    if last_values.get(prop_name) == value:
+                        if debug:
+                            _LOGGER.debug("Property '%s' unchanged (%s); not dispatched", prop_name, value)
+                        continue
+                    last_values[prop_name] = value
+                route = get_route(prop_name)
+                if not route:
+                    if debug:
+                        _LOGGER.debug("No listeners for property '%s'", prop_name)
+                    continue
+                if debug:
+                    _LOGGER.debug("Dispatching property '%s' to %d listeners", prop_name, len(route))
+
+                # Phase 1 Fix: Protected callback execution with timeout and task management
+                for cb, kind in route:
+                    if kind == _RUN_IN_EXECUTOR:
+                        add_sync_call((prop_name, cb, value))
+                        continue
+                    if kind == _CALL_INLINE:
+                        try:
+                            cb(value)
+                        except Exception as e:
+                            _LOGGER.error("Error in callback for '%s': %s", prop_name, e)
+                        continue
+                    if len(pending) == pending.maxlen:
+                        dropped += 1
+                    queue_call((prop_name, cb, value))
+
+        if dropped:
+            _LOGGER.warning("Callback queue full (%d pending); dropped the %d oldest invocation(s)",
+                            len(pending), dropped)
+
+        if pending and not self._draining and (self._drain_task is None or self._drain_task.done()):
+            # Usually every queued callback finishes without suspending; an
+            # eager start then delivers them here, without a loop round-trip.
+            task = _start_task(self._drain_callbacks())
+            self._drain_task = task
+            # Tracked like any callback task so stop() cancels it
+            self._active_tasks.add(task)
+            task.add_done_callback(self._remove_task)
+
+        if sync_calls:
+            # Phase 1 Fix: Run synchronous callbacks in thread pool to avoid blocking
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, _run_sync_callbacks, sync_calls)
+
+    async def _drain_callbacks(self) -> None:
+        """Await queued async callbacks in arrival order until the queue is empty.
+
+        Each invocation keeps its own timeout and error containment, so one
+        slow or failing callback cannot break delivery to the rest. The task
+        exits once the queue is drained; the next dispatch starts a new one.
+        """
+        pending = self._pending
+        # Bound once per drain, not re-resolved for every queued invocation
+        popleft = pending.popleft
+        timeout = asyncio.timeout
+        callback_timeout = self._callback_timeout
+        self._draining = True
+        try:
+            while pending:
+                prop_name, cb, value = popleft()
                 try:
-                    if asyncio.iscoroutinefunction(cb):
-                        # Wrap callback with timeout protection
-                        callback_coro = asyncio.wait_for(cb(value), timeout=self._callback_timeout)
-                        task = asyncio.create_task(callback_coro)
-                        
-                        # Add to active tasks and set up cleanup
-                        self._active_tasks.add(task)
-                        task.add_done_callback(self._remove_task)
-                        
-                    else:
-                        # Phase 1 Fix: Run synchronous callbacks in thread pool to avoid blocking
-                        loop = asyncio.get_running_loop()
-                        await loop.run_in_executor(None, cb, value)
-                        
+                    # Phase 1 Fix: Wrap callback with timeout protection
+                    awaitable = cb(value)
+                    if awaitable is not None:
+                        # Awaited in place under a deadline: no wrapper Task per
+                        # invocation, and a callback that never suspends
+                        # completes without a loop round-trip.
+                        async with timeout(callback_timeout):
+                            await awaitable
                 except asyncio.TimeoutError:
-                    _LOGGER.warning("Callback timeout for property '%s' after %.1f seconds", 
-                                  prop_name, self._callback_timeout)
+                    _LOGGER.warning("Callback timeout for property '%s' after %.1f seconds",
+                                  prop_name, callback_timeout)
                 except Exception as e:
                     _LOGGER.error("Error in callback for '%s': %s", prop_name, e)
+        finally:
+            self._draining = False
+
+    def _notify_properties(self, xml) -> Dict[str, str]:
+        """Track an ``<emotivaNotify>`` frame's sequence and return its properties.
+
+        Only properties that have a callback are extracted, so the result is
+        empty -- without extracting anything -- while no callback is
+        registered.
+        """
+        # Sequence tracking: detect missed notifications (spec §2.6).
+        sequence = xml.get("sequence")
+        if sequence:
+            _LOGGER.debug("Processing notification sequence %s", sequence)
+            try:
+                seq = int(sequence)
+            except ValueError:
+                seq = None
+            if seq is not None:
+                last = self.last_sequence
+                if last is not None and seq > last + 1:
+                    missed = seq - last - 1
+                    self.gap_count += missed
+                    _LOGGER.warning(
+                        "Notification sequence gap: %d -> %d (%d missed, %d total)",
+                        last, seq, missed, self.gap_count)
+                if last is None or seq > last:
+                    self.last_sequence = seq
+
+        if not self._routes:
+            # No callback registered at all: the sequence above is all this
+            # frame is needed for, so its properties are never extracted.
+            return {}
+
+        # Extract the routed properties using dual-format logic; a frame's
+        # other properties have no listener and are never materialised.
+        properties = self._extract_properties(xml, self._routes)
+
+        if properties:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Received notification with %d routed properties: %s",
+                            len(properties), ", ".join(properties))
+        elif len(xml):
+            _LOGGER.debug("Received notification with no routed properties")
         else:
-            _LOGGER.debug("No listeners for property '%s'", prop_name)
+            _LOGGER.warning("Received emotivaNotify with no extractable properties")
+        return properties
+
+    def _frame_properties(self, data: bytes) -> Dict[str, str] | None:
+        """Parse one notify-port datagram; return its properties, or None to skip it."""
+        if data.startswith(_UNHANDLED_ROOTS, _root_offset(data)):
+            # Menu / bar notifications (future enhancement)
+            _LOGGER.debug("Skipping menu/bar notification (not implemented)")
+            return None
+        xml = parse_xml(data)
+        if xml.tag != "emotivaNotify":
+            _LOGGER.warning("Unexpected message type on notify port: %s", xml.tag)
+            return None
+        return self._notify_properties(xml)
 
     async def _run(self):
         _LOGGER.debug("Dispatcher listening on port %s", self.notify_port_name)
+        port_name = self.notify_port_name
+        # The loop lives as long as the connection; resolve its callees once.
+        recv = self.socket_mgr.recv
+        # Optional on the socket manager: without it, each frame is its own
+        # batch (a missing method must not turn into a per-frame error).
+        recv_ready = getattr(self.socket_mgr, "recv_ready", None)
+        frame_properties = self._frame_properties
+        dispatch_frames = self._dispatch_frames
         while True:
             try:
-                data, _ = await self.socket_mgr.recv(self.notify_port_name)
-                xml = parse_xml(data)
-                
-                if xml.tag == "emotivaNotify":
-                    # Sequence tracking: detect missed notifications (spec §2.6).
-                    sequence = xml.get("sequence")
-                    if sequence:
-                        _LOGGER.debug("Processing notification sequence %s", sequence)
-                        try:
-                            seq = int(sequence)
-                        except ValueError:
-                            seq = None
-                        if seq is not None:
-                            last = self.last_sequence
-                            if last is not None and seq > last + 1:
-                                missed = seq - last - 1
-                                self.gap_count += missed
-                                _LOGGER.warning(
-                                    "Notification sequence gap: %d -> %d (%d missed, %d total)",
-                                    last, seq, missed, self.gap_count)
-                            if last is None or seq > last:
-                                self.last_sequence = seq
-                    
-                    # Extract all properties from the notification using dual-format logic
-                    properties = self._extract_properties(xml)
-                    
+                data, _ = await recv(port_name)
+                # Frames that queued up meanwhile (typically while the previous
+                # batch's sync callbacks ran) are taken along and fanned out
+                # as ONE batch: one executor job for the lot, not one per frame.
+                frames = [data]
+                if recv_ready is not None:
+                    frames.extend(d for d, _ in recv_ready(port_name))
+                batch: list[Dict[str, str]] = []
+                for data in frames:
+                    # Each frame is contained on its own: a malformed one is
+                    # logged and dropped without losing the rest of the batch.
+                    try:
+                        properties = frame_properties(data)
+                    except Exception as e:
+                        _LOGGER.error("Error in notification dispatcher: %s", e)
+                        continue
                     if properties:
-                        _LOGGER.debug("Received notification with %d properties: %s", 
-                                    len(properties), list(properties.keys()))
-                        
-                        # Dispatch each property to its listeners
-                        for prop_name, value in properties.items():
-                            await self._dispatch_property(prop_name, value)
-                    else:
-                        _LOGGER.warning("Received emotivaNotify with no extractable properties")
-                        
-                elif xml.tag == "emotivaMenuNotify":
-                    # Handle menu notifications (future enhancement)
-                    _LOGGER.debug("Received menu notification (not implemented)")
-                    
-                elif xml.tag == "emotivaBarNotify":
-                    # Handle bar notifications (future enhancement) 
-                    _LOGGER.debug("Received bar notification (not implemented)")
-                    
-                else:
-                    _LOGGER.warning("Unexpected message type on notify port: %s", xml.tag)
-                    
+                        batch.append(properties)
+                if batch:
+                    await dispatch_frames(batch)
+
             except asyncio.CancelledError:
                 _LOGGER.debug("Dispatcher task cancelled")
                 raise
@@ -0,0 +1,37 @@
+"""Event-loop selection: uvloop (winloop on Windows) when it is installed."""
+from __future__ import annotations
+
+import asyncio
+import sys
+from importlib import import_module
+from typing import Callable
+
+from .logging import get_logger
+
+# Module logger
+_LOGGER = get_logger("eventloop")
+
+# The libuv-based drop-in loop for this platform; both expose new_event_loop().
+_FAST_LOOP_MODULE = "winloop" if sys.platform == "win32" else "uvloop"
+
+def fast_loop_factory() -> Callable[[], asyncio.AbstractEventLoop]:
+    """Return the fastest available event-loop factory.
+
+    ``uvloop.new_event_loop`` (``winloop`` on Windows) when importable --
+    ``pip install "pymotivaxmc2[uvloop]"`` -- otherwise
+    ``asyncio.new_event_loop``. Pass it to the runner once at process start::
+
+        asyncio.run(main(), loop_factory=fast_loop_factory())   # 3.12+
+        with asyncio.Runner(loop_factory=fast_loop_factory()) as runner:
+            runner.run(main())                                  # 3.11
+
+    No global event-loop policy is touched, so other loops in the process are
+    unaffected.
+    """
+    try:
+        module = import_module(_FAST_LOOP_MODULE)
+    except ImportError:
+        _LOGGER.debug("%s not installed; using the asyncio event loop", _FAST_LOOP_MODULE)
+        return asyncio.new_event_loop
+    _LOGGER.debug("Using the %s event loop", _FAST_LOOP_MODULE)
+    return module.new_event_loop
@@ -2,9 +2,13 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import random
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Final, Mapping
+from xml.etree.ElementTree import ParseError
 
+from .constants import DEFAULT_PROTOCOL_VERSION, NAMED_PROPERTIES_VERSION
 from .logging import get_logger
 from .xmlcodec import build_command, build_update, build_subscribe, parse_xml
 from .dispatcher import Dispatcher
@@ -13,8 +17,33 @@
 # Module logger
 _LOGGER = get_logger("protocol")
 
+# Shared read-only default for parameterless commands (most of them), so a
+# send does not allocate a throwaway dict just to copy it.
+_NO_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
+# Failures worth another attempt: the network (send/receive errors) and a
+# garbled reply. Anything else is a bug and propagates at once rather than
+# costing a backoff sleep and more packets at the device.
+_RETRYABLE_ERRORS: Final = (OSError, ParseError)
+
+class _ReadBatch:
+    """Status reads queued behind another control transaction, sent as one Update."""
+
+    __slots__ = ("key", "names", "future")
+
+    def __init__(self, key: tuple[float, int | None], properties: list[str],
+                 future: asyncio.Future[dict[str, dict[str, Any]]]):
+        self.key = key
+        # Insertion-ordered set: the request lists names in arrival order
+        self.names: dict[str, None] = dict.fromkeys(properties)
+        self.future = future
+
+def _select(results: dict[str, dict[str, Any]], properties: list[str]) -> dict[str, dict[str, Any]]:
+    """The entries of a (possibly shared) read's ``results`` one caller asked for."""
+    return {name: results[name] for name in dict.fromkeys(properties) if name in results}
+
 class Protocol:
-    def __init__(self, socket_mgr, protocol_version: str = "2.0", ack_timeout: float = 2.0,
+    def __init__(self, socket_mgr, protocol_version: str = DEFAULT_PROTOCOL_VERSION, ack_timeout: float = 2.0,
                  max_retries: int = 3, min_send_interval: float = 0.0):
         """Args:
             socket_mgr: The bound :class:`SocketManager`.
@@ -52,11 +81,28 @@ def __init__(self, socket_mgr, protocol_version: str = "2.0", ack_timeout: float
         self._max_backoff = 8.0   # Maximum backoff time
         self._min_send_interval = min_send_interval
         self._last_send_monotonic: float | None = None
+        # The status read currently waiting for the control lock, open for
+        # other reads (same timeout and retries) to join; see
+        # request_properties_full.
+        self._read_batch: _ReadBatch | None = None
 
         _LOGGER.debug("Protocol initialized with version=%s, ack_timeout=%.1f (serialized control port, "
                     "max_retries=%d, min_send_interval=%.2f)",
                     protocol_version, ack_timeout, max_retries, min_send_interval)
 
+    @property
+    def protocol_version(self) -> str:
+        """Negotiated protocol version string."""
+        return self._protocol_version
+
+    @protocol_version.setter
+    def protocol_version(self, value: str) -> None:
+        self._protocol_version = value
+        # Protocol 3.0+ reports properties as <property name=".."/> elements,
+        # 2.0 as one element per property. Resolve the dialect once here
+        # rather than string-comparing the version on every reply frame.
+        self._named_properties = value >= NAMED_PROPERTIES_VERSION
+
     def _attempts(self, retries: int | None) -> int:
         """Total attempts for a transaction.
 
@@ -73,15 +119,20 @@ def _attempts(self, retries: int | None) -> int:
 
     async def _send_control(self, data: bytes) -> None:
         """Pace, drain stale frames, and send one control-port datagram."""
-        if self._min_send_interval > 0 and self._last_send_monotonic is not None:
-            loop = asyncio.get_event_loop()
+        if self._min_send_interval <= 0:
+            # Unpaced: nothing ever reads a send timestamp, so take none.
+            self.socket_mgr.drain("controlPort")
+            await self.socket_mgr.send(data, "controlPort")
+            return
+        loop = asyncio.get_running_loop()
+        if self._last_send_monotonic is not None:
             wait = self._min_send_interval - (loop.time() - self._last_send_monotonic)
             if wait > 0:
                 _LOGGER.debug("Pacing control-port send: sleeping %.3fs", wait)
                 await asyncio.sleep(wait)
         self.socket_mgr.drain("controlPort")
         await self.socket_mgr.send(data, "controlPort")
-        self._last_send_monotonic = asyncio.get_event_loop().time()
+        self._last_send_monotonic = loop.time()
 
     async def _recv_expected(self, expected_tag: str, timeout: float):
         """Receive control-port frames until one matches ``expected_tag``.
@@ -96,7 +147,7 @@ async def _recv_expected(self, expected_tag: str, timeout: float):
         Raises:
             asyncio.TimeoutError: if no matching frame arrives in ``timeout``.
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         deadline = loop.time() + timeout
         while True:
             remaining = deadline - loop.time()
@@ -109,6 +160,23 @@ async def _recv_expected(self, expected_tag: str, timeout: float):
             _LOGGER.warning("Discarding stale control-port frame '%s' (waiting for '%s')",
                             xml.tag, expected_tag)
 
+    async def _await_late_reply(self, expected_tag: str, window: float):
+        """Listen for ``expected_tag`` through a retry backoff of ``window`` seconds.
+
+        The device answers when it can: the reply to an attempt that just
+        timed out often lands during the backoff. Returning it here completes
+        the transaction without a re-send (for a relative command such as
+        ``volume +1``, a re-send would be applied twice). Returns None once the
+        window passes, or on a garbled frame, and the caller retries.
+        """
+        try:
+            return await self._recv_expected(expected_tag, window)
+        except asyncio.TimeoutError:
+            return None
+        except _RETRYABLE_ERRORS as e:
+            _LOGGER.warning("Error while awaiting a late '%s': %s", expected_tag, e)
+            return None
+
     async def send_command(self, name: str, params: dict[str, Any] | None = None,
                            *, retries: int | None = None, ack: bool = True):
         """Send a command as one serialized control-port transaction.
@@ -135,7 +203,7 @@ async def send_command(self, name: str, params: dict[str, Any] | None = None,
         async with self._control_lock:
             _LOGGER.info("Sending command '%s' with params %s (retries=%s, ack=%s)",
                          name, params, retries, ack)
-            attributes: dict[str, Any] = dict(params or {})
+            attributes: dict[str, Any] = dict(params or _NO_PARAMS)
             attributes["ack"] = "yes" if ack else "no"
             data = build_command(name, self.protocol_version, **attributes)
 
@@ -175,10 +243,13 @@ async def send_command(self, name: str, params: dict[str, Any] | None = None,
                         sleep_time = backoff_time + jitter
                         _LOGGER.warning("Command '%s' timeout on attempt %d, retrying in %.2f seconds", 
                                       name, attempt + 1, sleep_time)
-                        await asyncio.sleep(sleep_time)
+                        xml = await self._await_late_reply("emotivaAck", sleep_time)
+                        if xml is not None:
+                            _LOGGER.info("Late ack for command '%s' arrived during backoff", name)
+                            return xml
                     else:
                         _LOGGER.error("Command '%s' failed after %d attempts", name, attempts)
-                except Exception as e:
+                except _RETRYABLE_ERRORS as e:
                     if attempt < attempts - 1:
                         _LOGGER.warning("Command '%s' error on attempt %d: %s, retrying", 
                                       name, attempt + 1, e)
@@ -220,101 +291,187 @@ async def request_properties_full(
         ``<property name="source" value="HDMI 1" visible="true" status="ack"/>``)
         and is defaulted to ``True`` when absent (e.g. Protocol 2.0 responses,
         which the doc only specifies with element names and no visible flag).
+
+        Reads that have to queue behind another control transaction are
+        coalesced: the first one to wait opens a batch, reads arriving while it
+        waits (with the same ``timeout`` and ``retries``) add their names to it,
+        and the batch goes out as ONE Update once the lock is free. Each caller
+        gets back only the names it asked for. A read that finds the control
+        port idle is sent at once, exactly as before.
         """
-        async with self._control_lock:
-            _LOGGER.info("Requesting properties: %s (timeout=%.1f, retries=%s)",
-                         properties, timeout, retries)
+        key = (timeout, retries)
+        while True:
+            batch = self._read_batch
+            if batch is None or batch.key != key:
+                return await self._lead_read_batch(properties, key)
+            _LOGGER.debug("Joining queued property read with %s", properties)
+            batch.names.update(dict.fromkeys(properties))
+            try:
+                results = await asyncio.shield(batch.future)
+            except asyncio.CancelledError:
+                if batch.future.cancelled():
+                    continue  # its leader was cancelled; go again
+                raise
+            return _select(results, properties)
+
+    async def _lead_read_batch(self, properties: list[str],
+                               key: tuple[float, int | None]) -> dict[str, dict[str, Any]]:
+        """Open a read batch, wait for the control lock, and send it for every member."""
+        batch = _ReadBatch(key, properties, asyncio.get_running_loop().create_future())
+        self._read_batch = batch
+        try:
+            async with self._control_lock:
+                # Closed to joiners from here on: the request goes out with
+                # the names gathered while waiting for the lock.
+                if self._read_batch is batch:
+                    self._read_batch = None
+                results = await self._request_properties_locked(list(batch.names), *key)
+        except asyncio.CancelledError:
+            batch.future.cancel()
+            raise
+        except BaseException as e:
+            batch.future.set_exception(e)
+            # Joiners receive it through shield(); marking it retrieved here
+            # keeps a batch whose joiners were all cancelled (or that never
+            # had any) from logging "Future exception was never retrieved".
+            batch.future.exception()
+            raise
+        finally:
+            if self._read_batch is batch:
+                self._read_batch = None
+        batch.future.set_result(results)
+        return _select(results, properties)
+
+    async def _request_properties_locked(self, properties: list[str], timeout: float,
+                                         retries: int | None) -> dict[str, dict[str, Any]]:
+        """One Update transaction for ``properties``; the caller holds the control lock."""
+        _LOGGER.info("Requesting properties: %s (timeout=%.1f, retries=%s)",
+                     properties, timeout, retries)
+
+        attempts = self._attempts(retries)
+        # Reply frames are matched against the request once per property
+        # element; a frozenset makes that an O(1) probe instead of a scan
+        # of the request list.
+        wanted = frozenset(properties)
+        # The wait below ends the moment every DISTINCT name has arrived;
+        # counting the request list instead would never be satisfied by a
+        # list with repeats and sat out the whole timeout plus retries.
+        expected = len(wanted)
+        # Per-property reply logging renders each {value, visible} dict;
+        # decide once per transaction whether anyone will read it.
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        # Results ACCUMULATE across attempts, and each retry re-requests only
+        # the still-missing properties — never the whole batch (re-sending the
+        # full batch multiplied packets at the device exactly when it was
+        # slow to answer).
+        results: dict[str, dict[str, Any]] = {}
+        last_exception = None
+        for attempt in range(attempts):
+            try:
+                outstanding = [p for p in dict.fromkeys(properties) if p not in results]
+                if not outstanding:
+                    return results
+                # Calculate adaptive timeout
+                adaptive_timeout = timeout
+                if attempt > 0:
+                    adaptive_timeout = timeout * (1.5 ** attempt)
+                    _LOGGER.debug("Property request retry %d for missing %s with timeout %.2f",
+                                attempt + 1, outstanding, adaptive_timeout)
 
-            attempts = self._attempts(retries)
-            # Results ACCUMULATE across attempts, and each retry re-requests only
-            # the still-missing properties — never the whole batch (re-sending the
-            # full batch multiplied packets at the device exactly when it was
-            # slow to answer).
-            results: dict[str, dict[str, Any]] = {}
-            last_exception = None
-            for attempt in range(attempts):
-                try:
-                    outstanding = [p for p in properties if p not in results]
-                    if not outstanding:
-                        return results
-                    # Calculate adaptive timeout
-                    adaptive_timeout = timeout
-                    if attempt > 0:
-                        adaptive_timeout = timeout * (1.5 ** attempt)
-                        _LOGGER.debug("Property request retry %d for missing %s with timeout %.2f",
-                                    attempt + 1, outstanding, adaptive_timeout)
-
-                    await self._send_control(build_update(outstanding, self.protocol_version))
-
-                    start_time = asyncio.get_event_loop().time()
-                    remaining_time = adaptive_timeout
-
-                    while len(results) < len(properties) and remaining_time > 0:
-                        try:
-                            xml_bytes, _ = await self.socket_mgr.recv("controlPort", timeout=remaining_time)
-                            xml = parse_xml(xml_bytes)
-
-                            if xml.tag == "emotivaNotify" or xml.tag == "emotivaUpdate":
-                                # Protocol 3.0+ uses property elements with name attributes
-                                if self.protocol_version >= "3.0":
-                                    for prop_elem in xml.findall("property"):
-                                        prop_name = prop_elem.get("name")
-                                        if prop_name in properties:
-                                            results[prop_name] = {
-                                                "value": prop_elem.get("value", ""),
-                                                "visible": prop_elem.get("visible", "true") == "true",
-                                            }
-                                            _LOGGER.debug("Received property '%s' = %s (v3.0+ format)",
-                                                        prop_name, results[prop_name])
-                                # Protocol 2.0 uses direct element names
-                                else:
-                                    for prop_elem in xml:
-                                        if prop_elem.tag in properties:
-                                            results[prop_elem.tag] = {
-                                                "value": prop_elem.text or prop_elem.get("value", ""),
-                                                "visible": prop_elem.get("visible", "true") == "true",
-                                            }
-                                            _LOGGER.debug("Received property '%s' = %s (v2.0 format)",
-                                                        prop_elem.tag, results[prop_elem.tag])
-                            else:
-                                _LOGGER.debug("Received unexpected tag '%s'", xml.tag)
-
-                            # Update remaining time
-                            elapsed = asyncio.get_event_loop().time() - start_time
-                            remaining_time = adaptive_timeout - elapsed
-                        except asyncio.TimeoutError:
-                            _LOGGER.warning("Timeout waiting for more property responses")
-                            break
-
-                    # Log completion status
-                    if len(results) == len(properties):
-                        _LOGGER.info("Received all requested properties (attempt %d)", attempt + 1)
-                        return results
-                    else:
-                        missing = set(properties) - set(results.keys())
-                        if attempt < attempts - 1:
-                            _LOGGER.warning("Missing properties %s on attempt %d, retrying (missing only)",
-                                          missing, attempt + 1)
-                            await asyncio.sleep(self._base_backoff * (attempt + 1))
-                            continue
-                        else:
-                            _LOGGER.warning("Missing properties in final response: %s", missing)
-                            return results
+                await self._send_control(build_update(outstanding, self.protocol_version))
 
-                except Exception as e:
-                    last_exception = e
+                if not await self._collect_update_replies(results, wanted, adaptive_timeout, debug):
+                    _LOGGER.warning("Timeout waiting for more property responses")
+
+                # Log completion status
+                if len(results) == expected:
+                    _LOGGER.info("Received all requested properties (attempt %d)", attempt + 1)
+                    return results
+                else:
+                    missing = wanted - results.keys()
                     if attempt < attempts - 1:
-                        _LOGGER.warning("Property request error on attempt %d: %s, retrying",
-                                      attempt + 1, e)
-                        await asyncio.sleep(self._base_backoff * (attempt + 1))
+                        backoff_time = self._base_backoff * (attempt + 1)
+                        _LOGGER.warning("Missing properties %s on attempt %d, retrying (missing only)",
+                                      missing, attempt + 1)
+                        # Keep listening through the backoff instead of
+                        # sleeping: a late reply carrying the missing names
+                        # completes the read here, with no re-send (a blind
+                        # sleep left it to be drained as stale and asked
+                        # the device again).
+                        if await self._collect_update_replies(results, wanted, backoff_time, debug):
+                            _LOGGER.info("Late reply completed the request during backoff")
+                            return results
+                        continue
                     else:
-                        _LOGGER.error("Property request failed after %d attempts: %s",
-                                    attempts, e)
-                        raise
+                        _LOGGER.warning("Missing properties in final response: %s", missing)
+                        return results
 
-            if last_exception:
-                raise last_exception
-            return results
+            except _RETRYABLE_ERRORS as e:
+                last_exception = e
+                if attempt < attempts - 1:
+                    _LOGGER.warning("Property request error on attempt %d: %s, retrying",
+                                  attempt + 1, e)
+                    await asyncio.sleep(self._base_backoff * (attempt + 1))
+                else:
+                    _LOGGER.error("Property request failed after %d attempts: %s",
+                                attempts, e)
+                    raise
+
+        if last_exception:
+            raise last_exception
+        return results
+
+    async def _collect_update_replies(self, results: dict[str, dict[str, Any]],
+                                      wanted: frozenset[str], window: float,
+                                      debug: bool) -> bool:
+        """Receive Update replies into ``results`` for up to ``window`` seconds.
+
+        Returns as soon as every name in ``wanted`` has a result (True), or
+        False once the window passes without that.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + window
+        remaining_time = window
+        expected = len(wanted)
+        while len(results) < expected and remaining_time > 0:
+            try:
+                xml_bytes, _ = await self.socket_mgr.recv("controlPort", timeout=remaining_time)
+            except asyncio.TimeoutError:
+                break
+            xml = parse_xml(xml_bytes)
+
+            # The reply to an Update is almost always an
+            # emotivaUpdate; test that first and short-circuit.
+            tag = xml.tag
+            if tag == "emotivaUpdate" or tag == "emotivaNotify":
+                # Protocol 3.0+ uses property elements with name attributes
+                if self._named_properties:
+                    for prop_elem in xml.findall("property"):
+                        prop_name = prop_elem.get("name")
+                        if prop_name in wanted:
+                            results[prop_name] = {
+                                "value": prop_elem.get("value", ""),
+                                "visible": prop_elem.get("visible", "true") == "true",
+                            }
+                            if debug:
+                                _LOGGER.debug("Received property '%s' = %s (v3.0+ format)",
+                                              prop_name, results[prop_name])
+                # Protocol 2.0 uses direct element names
+                else:
+                    for prop_elem in xml:
+                        if prop_elem.tag in wanted:
+                            results[prop_elem.tag] = {
+                                "value": prop_elem.text or prop_elem.get("value", ""),
+                                "visible": prop_elem.get("visible", "true") == "true",
+                            }
+                            if debug:
+                                _LOGGER.debug("Received property '%s' = %s (v2.0 format)",
+                                              prop_elem.tag, results[prop_elem.tag])
+            else:
+                _LOGGER.debug("Received unexpected tag '%s'", xml.tag)
+
+            remaining_time = deadline - loop.time()
+        return len(results) == expected
 
     async def subscribe(self, properties: list[str], *, retries: int | None = None) -> Dict[str, Any]:
         """Subscribe to property updates (one serialized transaction).
@@ -326,6 +483,8 @@ async def subscribe(self, properties: list[str], *, retries: int | None = None)
         """
         async with self._control_lock:
             _LOGGER.info("Subscribing to properties: %s (retries=%s)", properties, retries)
+            # Every attempt re-sends the same request: serialize it once.
+            data = build_subscribe(properties, self.protocol_version)
 
             attempts = self._attempts(retries)
             last_exception: Exception | None = None
@@ -337,61 +496,26 @@ async def subscribe(self, properties: list[str], *, retries: int | None = None)
                         timeout = self.ack_timeout * (1.5 ** attempt)
                         _LOGGER.debug("Subscription retry %d with timeout %.2f", attempt + 1, timeout)
                     
-                    await self._send_control(build_subscribe(properties, self.protocol_version))
+                    await self._send_control(data)
 
                     # Wait for the subscription confirmation; stale frames are
                     # discarded inside instead of burning the attempt.
                     xml = await self._recv_expected("emotivaSubscription", timeout)
+                    return await self._complete_subscription(xml, properties, attempt)
 
-                    results = {}
-                    # Protocol 3.0+ uses property elements with name attributes
-                    if self.protocol_version >= "3.0":
-                        for prop_elem in xml.findall("property"):
-                            prop_name = prop_elem.get("name")
-                            status = prop_elem.get("status")
-                            if status == "ack":
-                                results[prop_name] = {
-                                    "value": prop_elem.get("value", ""),
-                                    "visible": prop_elem.get("visible", "true") == "true"
-                                }
-                                _LOGGER.debug("Subscribed to '%s' = '%s'", prop_name, results[prop_name])
-                            else:
-                                _LOGGER.warning("Failed to subscribe to '%s'", prop_name)
-                    # Protocol 2.0 uses direct element names
-                    else:
-                        for prop_elem in xml:
-                            status = prop_elem.get("status")
-                            if status == "ack":
-                                results[prop_elem.tag] = {
-                                    "value": prop_elem.get("value", ""),
-                                    "visible": prop_elem.get("visible", "true") == "true"
-                                }
-                                _LOGGER.debug("Subscribed to '%s' = '%s'", prop_elem.tag, results[prop_elem.tag])
-                            else:
-                                _LOGGER.warning("Failed to subscribe to '%s'", prop_elem.tag)
-                                
-                    _LOGGER.info("Successfully subscribed to %d/%d properties (attempt %d)",
-                               len(results), len(properties), attempt + 1)
-
-                    # Fan the initial values the device just sent us out to any
-                    # registered listeners, so consumers that use the @on(prop)
-                    # callback pattern receive subscribe-time state through the
-                    # same path as ongoing notifications. The return value is
-                    # unaffected (backward-compatible for callback-less callers).
-                    await self._dispatch_initial_values(results)
-
-                    return results
-                    
                 except asyncio.TimeoutError:
                     last_exception = AckTimeoutError("No subscription confirmation received")
                     if attempt < attempts - 1:
                         backoff_time = self._base_backoff * (2 ** attempt)
                         _LOGGER.warning("Subscription timeout on attempt %d, retrying in %.2f seconds", 
                                       attempt + 1, backoff_time)
-                        await asyncio.sleep(backoff_time)
+                        xml = await self._await_late_reply("emotivaSubscription", backoff_time)
+                        if xml is not None:
+                            _LOGGER.info("Late subscription confirmation arrived during backoff")
+                            return await self._complete_subscription(xml, properties, attempt)
                     else:
                         _LOGGER.error("Subscription failed after %d attempts", attempts)
-                except Exception as e:
+                except _RETRYABLE_ERRORS as e:
                     last_exception = e
                     if attempt < attempts - 1:
                         _LOGGER.warning("Subscription error on attempt %d: %s, retrying", 
@@ -406,6 +530,47 @@ async def subscribe(self, properties: list[str], *, retries: int | None = None)
                 raise last_exception
             return {}
 
+    async def _complete_subscription(self, xml, properties: list[str],
+                                     attempt: int) -> Dict[str, Any]:
+        """Collect a Subscribe reply's acked values and fan them out to listeners."""
+        results: Dict[str, Any] = {}
+        # Protocol 3.0+ uses property elements with name attributes
+        if self._named_properties:
+            for prop_elem in xml.findall("property"):
+                prop_name = prop_elem.get("name")
+                status = prop_elem.get("status")
+                if status == "ack":
+                    results[prop_name] = {
+                        "value": prop_elem.get("value", ""),
+                        "visible": prop_elem.get("visible", "true") == "true"
+                    }
+                    _LOGGER.debug("Subscribed to '%s' = '%s'", prop_name, results[prop_name])
+                else:
+                    _LOGGER.warning("Failed to subscribe to '%s'", prop_name)
+        # Protocol 2.0 uses direct element names
+        else:
+            for prop_elem in xml:
+                status = prop_elem.get("status")
+                if status == "ack":
+                    results[prop_elem.tag] = {
+                        "value": prop_elem.get("value", ""),
+                        "visible": prop_elem.get("visible", "true") == "true"
+                    }
+                    _LOGGER.debug("Subscribed to '%s' = '%s'", prop_elem.tag, results[prop_elem.tag])
+                else:
+                    _LOGGER.warning("Failed to subscribe to '%s'", prop_elem.tag)
+
+        _LOGGER.info("Successfully subscribed to %d/%d properties (attempt %d)",
+                     len(results), len(properties), attempt + 1)
+
+        # Fan the initial values the device just sent us out to any
+        # registered listeners, so consumers that use the @on(prop)
+        # callback pattern receive subscribe-time state through the
+        # same path as ongoing notifications. The return value is
+        # unaffected (backward-compatible for callback-less callers).
+        await self._dispatch_initial_values(results)
+        return results
+
     async def _dispatch_initial_values(self, results: Dict[str, Dict[str, Any]]) -> None:
         """Push subscribe-time values through the dispatcher's callback path.
 
@@ -416,20 +581,26 @@ async def _dispatch_initial_values(self, results: Dict[str, Dict[str, Any]]) ->
         dispatcher that handles ongoing ``emotivaNotify`` packets — a single
         update path for subscribe-time and notification-time data.
 
-        No-op when no dispatcher is wired (standalone protocol use). Each
+        No-op when no dispatcher is wired (standalone protocol use). The
         dispatch is guarded so a misbehaving consumer callback cannot break the
         subscription; this mirrors the per-callback resilience already in
-        :meth:`Dispatcher._dispatch_property`.
+        :meth:`Dispatcher._dispatch_properties`.
         """
         dispatcher = self.dispatcher
         if dispatcher is None:
             return
-        for prop_name, info in results.items():
-            if not dispatcher.has_listeners(prop_name):
-                continue
-            try:
-                await dispatcher.dispatch(prop_name, info["value"])
-            except Exception as ex:
-                _LOGGER.exception(
-                    "Initial-value dispatch for '%s' raised: %s", prop_name, ex
-                )
+        # The whole response fans out as one frame: one pass over the routes
+        # and one executor job for sync callbacks, not one per property.
+        values = {
+            prop_name: info["value"]
+            for prop_name, info in results.items()
+            if dispatcher.has_listeners(prop_name)
+        }
+        if not values:
+            return
+        try:
+            await dispatcher.dispatch_many(values)
+        except Exception as ex:
+            _LOGGER.exception(
+                "Initial-value dispatch for %s raised: %s", list(values), ex
+            )
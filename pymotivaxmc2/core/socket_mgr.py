@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import socket as _socket
 from collections import defaultdict
 from typing import Callable, Dict, Tuple, Awaitable
@@ -12,6 +13,10 @@
 _LOGGER = get_logger("socket_mgr")
 
 class _DatagramProto(asyncio.DatagramProtocol):
+    # asyncio's protocol bases are slotted, so this keeps the per-datagram
+    # ``self.queue`` lookup in datagram_received off an instance __dict__.
+    __slots__ = ("queue", "transport")
+
     def __init__(self, queue: asyncio.Queue[Tuple[bytes, Tuple[str, int]]]):
         self.queue = queue
         self.transport: asyncio.DatagramTransport | None = None
@@ -112,8 +117,9 @@ async def stop(self):
     async def send(self, payload: bytes, port_name: str = "controlPort"):
         port = self.ports[port_name]
         transport = self._transports[port]
-        _LOGGER.debug("Sending %d bytes to %s:%d (%s)", len(payload), self.device_host, port, port_name)
-        log_xml(_LOGGER, "sent", payload)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Sending %d bytes to %s:%d (%s)", len(payload), self.device_host, port, port_name)
+            log_xml(_LOGGER, "sent", payload)
         transport.sendto(payload, (self.device_host, port))
 
     def drain(self, port_name: str) -> int:
@@ -139,13 +145,35 @@ def drain(self, port_name: str) -> int:
             _LOGGER.warning("Drained %d stale frame(s) from %s before new transaction", drained, port_name)
         return drained
 
+    def recv_ready(self, port_name: str) -> list[Tuple[bytes, Tuple[str, int]]]:
+        """Return every frame already queued for ``port_name``, without waiting.
+
+        Lets a consumer woken by :meth:`recv` take the rest of a burst in the
+        same pass instead of one loop wake-up per datagram.
+        """
+        queue = self._queues[self.ports[port_name]]
+        frames = []
+        # One level check per burst rather than two logging calls per frame.
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        while not queue.empty():
+            data, addr = queue.get_nowait()
+            if debug:
+                _LOGGER.debug("Received %d bytes from %s:%d on port %s", len(data), addr[0], addr[1], port_name)
+                log_xml(_LOGGER, "received", data)
+            frames.append((data, addr))
+        return frames
+
     async def recv(self, port_name: str, timeout: float | None = None):
         port = self.ports[port_name]
         queue = self._queues[port]
         try:
-            data, addr = await asyncio.wait_for(queue.get(), timeout=timeout)
-            _LOGGER.debug("Received %d bytes from %s:%d on port %s", len(data), addr[0], addr[1], port_name)
-            log_xml(_LOGGER, "received", data)
+            # asyncio.timeout() bounds the wait in place; wait_for() (3.11)
+            # wraps queue.get() in a fresh Task on every receive.
+            async with asyncio.timeout(timeout):
+                data, addr = await queue.get()
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Received %d bytes from %s:%d on port %s", len(data), addr[0], addr[1], port_name)
+                log_xml(_LOGGER, "received", data)
             return data, addr
         except asyncio.TimeoutError:
             _LOGGER.warning("Timeout waiting for data on port %s after %.1f seconds", port_name, timeout)
@@ -1,15 +1,35 @@
 """Creates & parses XML protocol messages."""
 from __future__ import annotations
 
+import logging
 import xml.etree.ElementTree as ET
-from typing import Any
+from functools import lru_cache
+from typing import Any, Final
 from xml.etree.ElementTree import Element
 
+from .constants import DEFAULT_PROTOCOL_VERSION, NAMED_PROPERTIES_VERSION
 from .logging import get_logger
 
 # Module logger
 _LOGGER = get_logger("xmlcodec")
 
+_XML_DECLARATION: Final[bytes] = b'<?xml version="1.0" encoding="utf-8"?>'
+
+# Attribute-value escapes, exactly as ElementTree writes them.
+_ATTR_ESCAPES: Final = str.maketrans({
+    "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;",
+    "\r": "&#13;", "\n": "&#10;", "\t": "&#09;",
+})
+
+def _encode(elem: Element) -> bytes:
+    """Serialize ``elem`` as a complete UTF-8 packet.
+
+    ElementTree encodes straight to bytes (no declaration of its own for
+    UTF-8), so the packet is one bytes join rather than a str concatenation
+    followed by a second, encoding copy.
+    """
+    return _XML_DECLARATION + ET.tostring(elem, encoding="utf-8", xml_declaration=False)
+
 def parse_xml(data: bytes) -> Element:
     """Parse XML from bytes into element."""
     try:
@@ -18,19 +38,17 @@ def parse_xml(data: bytes) -> Element:
         return xml
     except ET.ParseError as e:
         _LOGGER.error("Failed to parse XML: %s", e)
-        _LOGGER.debug("Invalid XML data: %s", data.decode('utf-8', errors='replace'))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Invalid XML data: %s", data.decode('utf-8', errors='replace'))
         raise
 
-def build_command(name: str, protocol_version: str = "2.0", **attributes: Any) -> bytes:
+def build_command(name: str, protocol_version: str = DEFAULT_PROTOCOL_VERSION, **attributes: Any) -> bytes:
     """Build a command XML message."""
     _LOGGER.debug("Building command XML: %s with attributes %s", name, attributes)
-    cmd = ET.Element("emotivaControl")
-    
+
     # Technically the protocol version is not needed in command packets according to the spec,
     # but we're keeping the parameter for consistency with other methods
     
-    sub = ET.SubElement(cmd, name)
-    
     # Always ensure we have a value attribute as required by the protocol spec
     if "value" not in attributes:
         attributes["value"] = "0"
@@ -38,44 +56,52 @@ def build_command(name: str, protocol_version: str = "2.0", **attributes: Any) -
     # Always ensure we have an ack attribute as shown in the spec examples
     if "ack" not in attributes:
         attributes["ack"] = "yes"
-        
-    for key, value in attributes.items():
-        sub.set(key, str(value))
-        
-    xml_str = '<?xml version="1.0" encoding="utf-8"?>'
-    return (xml_str + ET.tostring(cmd, encoding='unicode')).encode('utf-8')
 
-def build_update(properties: list[str], protocol_version: str = "2.0") -> bytes:
+    return _encode_command(name, tuple((key, str(value)) for key, value in attributes.items()))
+
+@lru_cache(maxsize=256)
+def _encode_command(name: str, attributes: tuple[tuple[str, str], ...]) -> bytes:
+    """Serialize one command element; memoized, as most commands repeat verbatim.
+
+    Parameterless commands (power, mute, volume steps, input selects) are the
+    same bytes on every call. A command packet is one fixed-shape element, so
+    it is formatted directly rather than built and serialized as an
+    ElementTree; the output is byte-identical to ElementTree's (same
+    attribute order, escaping and ``" />"`` close), which keeps the many
+    distinct values of e.g. ``set_volume`` cheap on a cache miss too.
+    """
+    attrs = "".join(f' {key}="{value.translate(_ATTR_ESCAPES)}"' for key, value in attributes)
+    return _XML_DECLARATION + f"<emotivaControl><{name}{attrs} /></emotivaControl>".encode("utf-8")
+
+def build_update(properties: list[str], protocol_version: str = DEFAULT_PROTOCOL_VERSION) -> bytes:
     """Build an update request for the specified properties."""
     _LOGGER.debug("Building update XML for properties: %s (protocol %s)", 
                 properties, protocol_version)
     elem = ET.Element("emotivaUpdate")
     
     # Add protocol attribute for V3.0+
-    if protocol_version >= "3.0":
+    if protocol_version >= NAMED_PROPERTIES_VERSION:
         elem.set("protocol", protocol_version)
     
     for name in properties:
         prop = ET.SubElement(elem, name)
         
-    xml_str = '<?xml version="1.0" encoding="utf-8"?>'
-    return (xml_str + ET.tostring(elem, encoding='unicode')).encode('utf-8')
+    return _encode(elem)
 
-def build_subscribe(properties: list[str], protocol_version: str = "2.0") -> bytes:
+def build_subscribe(properties: list[str], protocol_version: str = DEFAULT_PROTOCOL_VERSION) -> bytes:
     """Build a subscription request for the specified properties."""
     _LOGGER.debug("Building subscription XML for properties: %s (protocol %s)", 
                 properties, protocol_version)
     elem = ET.Element("emotivaSubscription")
     
     # Add protocol attribute for V3.0+
-    if protocol_version >= "3.0":
+    if protocol_version >= NAMED_PROPERTIES_VERSION:
         elem.set("protocol", protocol_version)
     
     for name in properties:
         prop = ET.SubElement(elem, name)
         
-    xml_str = '<?xml version="1.0" encoding="utf-8"?>'
-    return (xml_str + ET.tostring(elem, encoding='unicode')).encode('utf-8')
+    return _encode(elem)
 
 def build_unsubscribe(properties: list[str]) -> bytes:
     """Build an unsubscribe request for the specified properties."""
@@ -88,5 +114,4 @@ def build_unsubscribe(properties: list[str]) -> bytes:
     for name in properties:
         prop = ET.SubElement(elem, name)
         
-    xml_str = '<?xml version="1.0" encoding="utf-8"?>'
-    return (xml_str + ET.tostring(elem, encoding='unicode')).encode('utf-8')
+    return _encode(elem)
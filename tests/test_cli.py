@@ -1,6 +1,7 @@
 """Test cases for pymotivaxmc2.cli module."""
 
 import pytest
+import asyncio
 import argparse
 import sys
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -8,6 +9,7 @@
 
 from pymotivaxmc2.cli import (
     build_parser,
+    fast_parse,
     positive_float,
     do_power,
     do_volume,
@@ -15,6 +17,7 @@
     do_input,
     do_status,
     main,
+    run,
 )
 from pymotivaxmc2.enums import Zone, Input, Property
 from pymotivaxmc2.exceptions import InvalidArgumentError
@@ -253,6 +256,21 @@ async def test_do_status_valid_properties(self, mock_controller):
         assert "On" in output
         assert "-20.5" in output
 
+    @pytest.mark.asyncio
+    async def test_do_status_writes_table_once(self, mock_controller):
+        """do_status emits the whole table in one write, one line per property."""
+        mock_controller.status.return_value = {
+            Property.POWER: "On",
+            Property.VOLUME: "-20.5"
+        }
+
+        with patch('sys.stdout') as fake_stdout:
+            await do_status(mock_controller, ["power", "volume"])
+
+        fake_stdout.write.assert_called_once_with(
+            f"{'power':<15}: On\n{'volume':<15}: -20.5\n"
+        )
+
     @pytest.mark.asyncio
     async def test_do_status_invalid_property(self, mock_controller):
         """Test do_status with invalid property name."""
@@ -264,6 +282,22 @@ async def test_do_status_invalid_property(self, mock_controller):
         assert "Unknown property 'invalid_property'" in error_output
 
 
+class TestActionTables:
+    """The on/off/toggle tables cover every parser choice."""
+
+    def test_tables_match_switch_choices(self):
+        from pymotivaxmc2.cli import _MUTE_METHODS, _POWER_METHODS, _SWITCH_ACTIONS
+        assert set(_POWER_METHODS) == set(_SWITCH_ACTIONS)
+        assert set(_MUTE_METHODS) == set(_SWITCH_ACTIONS)
+
+    def test_tables_are_read_only(self):
+        from pymotivaxmc2.cli import _COMMANDS, _POWER_METHODS
+        with pytest.raises(TypeError):
+            _POWER_METHODS["on"] = "power_off"  # pyright: ignore[reportIndexIssue]
+        with pytest.raises(TypeError):
+            _COMMANDS["power"] = None  # pyright: ignore[reportIndexIssue]
+
+
 class TestMainFunction:
     """Test cases for main function."""
 
@@ -370,6 +404,125 @@ async def test_main_ensures_disconnect(self):
             mock_controller.disconnect.assert_called_once()
 
 
+class TestPrunedParser:
+    """build_parser(argv) builds only the subcommand tree the tokens invoke."""
+
+    def test_pruned_parser_parses_named_subcommand(self):
+        argv = ["--host", "192.168.1.100", "zone2", "volume", "up", "--step", "2"]
+        args = build_parser(argv).parse_args(argv)
+        assert args.cmd == "zone2"
+        assert args.z2cmd == "volume"
+        assert args.step == 2.0
+
+    @pytest.mark.parametrize("argv", [
+        ["--ho", "1.2.3.4", "power", "on"],
+        ["--hos", "power", "mute", "toggle"],
+        ["--host", "1.2.3.4", "powr", "on"],
+    ])
+    def test_pruned_parser_matches_full_parser(self, argv, capsys):
+        """Abbreviated --host and unknown subcommands parse (or fail) as with the full tree."""
+        def parse(parser):
+            try:
+                return vars(parser.parse_args(argv))
+            except SystemExit as exc:
+                return exc.code
+
+        assert parse(build_parser(argv)) == parse(build_parser())
+
+    def test_abbreviated_host_option_parses(self):
+        argv = ["--ho", "1.2.3.4", "power", "on"]
+        args = build_parser(argv).parse_args(argv)
+        assert (args.host, args.cmd, args.action) == ("1.2.3.4", "power", "on")
+
+    def test_pruned_parser_still_lists_every_subcommand(self):
+        parser = build_parser(["--host", "192.168.1.100", "power", "on"])
+        help_text = parser.format_help()
+        for name in ("power", "volume", "mute", "input", "status", "zone2"):
+            assert name in help_text
+
+    def test_pruned_parser_skips_unused_trees(self):
+        parser = build_parser(["--host", "192.168.1.100", "power", "on"])
+        sub = next(a for a in parser._actions if isinstance(a, argparse._SubParsersAction))
+        assert sub.choices["zone2"]._subparsers is None
+        assert sub.choices["power"]._actions[-1].dest == "action"
+
+
+class TestCommandTable:
+    """main() dispatches through the command table."""
+
+    def test_every_subcommand_has_a_handler(self):
+        from pymotivaxmc2.cli import _COMMANDS
+        parser = build_parser()
+        sub = next(a for a in parser._actions if isinstance(a, argparse._SubParsersAction))
+        assert set(_COMMANDS) == set(sub.choices)
+
+    @pytest.mark.asyncio
+    async def test_main_mute_command(self):
+        with patch('pymotivaxmc2.cli.EmotivaController') as mock_controller_cls:
+            mock_controller = AsyncMock()
+            mock_controller_cls.return_value = mock_controller
+
+            await main(["--host", "192.168.1.100", "mute", "off"])
+
+            mock_controller.mute_off.assert_called_once_with(zone=Zone.MAIN)
+
+
+class TestFastParse:
+    """fast_parse() mirrors argparse for hot commands and defers everything else."""
+
+    @pytest.mark.parametrize("argv", [
+        ["--host", "h", "power", "on"],
+        ["--host", "h", "mute", "toggle"],
+        ["--host", "h", "volume", "up"],
+        ["--host", "h", "volume", "down", "--step", "2.5"],
+        ["--host", "h", "volume", "set", "-28.5"],
+        ["--host", "h", "input", "set", "hdmi3"],
+        ["--host", "h", "status", "power", "volume"],
+    ])
+    def test_matches_argparse(self, argv):
+        assert vars(fast_parse(argv)) == vars(build_parser().parse_args(argv))
+
+    @pytest.mark.parametrize("argv", [
+        ["--help"],
+        ["--host", "h", "power", "sideways"],
+        ["--host", "h", "zone2", "power", "on"],
+        ["--host", "h", "volume", "set", "-inf"],
+        ["--host", "h", "status", "--help"],
+        ["--host=h", "power", "on"],
+    ])
+    def test_defers_to_argparse(self, argv):
+        assert fast_parse(argv) is None
+
+
+    def test_pruned_parser_ignores_later_tokens_naming_commands(self):
+        # 'power' here is a status property, not a second subcommand
+        parser = build_parser(["--host", "h", "status", "power", "volume"])
+        sub = next(a for a in parser._actions if isinstance(a, argparse._SubParsersAction))
+        assert sub.choices["power"]._actions[-1].dest == "help"
+        assert sub.choices["volume"]._subparsers is None
+
+
+class TestRunEntryPoint:
+    """run() drives the async main() for the console script."""
+
+    def test_run_uses_asyncio_without_uvloop(self):
+        argv = ["--host", "192.168.1.100", "power", "on"]
+        with patch.dict(sys.modules, {"uvloop": None}), \
+             patch('pymotivaxmc2.cli.main', new_callable=AsyncMock) as mock_main:
+            run(argv)
+        mock_main.assert_awaited_once_with(argv)
+
+    def test_run_prefers_uvloop_when_installed(self):
+        fake_uvloop = MagicMock()
+        fake_uvloop.new_event_loop.side_effect = asyncio.new_event_loop
+        argv = ["--host", "192.168.1.100", "power", "on"]
+        with patch.dict(sys.modules, {"uvloop": fake_uvloop}), \
+             patch('pymotivaxmc2.cli.main', new_callable=AsyncMock) as mock_main:
+            run(argv)
+        fake_uvloop.new_event_loop.assert_called_once()
+        mock_main.assert_awaited_once_with(argv)
+
+
 class TestCLIIntegration:
     """Integration tests for CLI functionality."""
 
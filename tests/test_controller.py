@@ -2,6 +2,7 @@
 
 import pytest
 import asyncio
+import socket
 from unittest.mock import AsyncMock, MagicMock, patch, call
 from typing import Dict, Any
 
@@ -115,7 +116,8 @@ async def test_connect_success(self, controller, mock_discovery_info):
             )
             
             # Verify dispatcher setup
-            mock_dispatcher_cls.assert_called_once_with(mock_socket_mgr, "notifyPort")
+            mock_dispatcher_cls.assert_called_once_with(mock_socket_mgr, "notifyPort",
+                                                        changes_only=False)
             mock_dispatcher.start.assert_called_once()
             
             # Verify controller state
@@ -165,6 +167,60 @@ async def test_connect_protocol_version_limiting(self, controller):
                 min_send_interval=0.0
             )
 
+    @pytest.mark.asyncio
+    async def test_reconnect_can_reuse_cached_transponder(self, controller, mock_discovery_info):
+        """rediscover=False skips the discovery round-trip once info is known."""
+        with patch('pymotivaxmc2.controller.Discovery') as mock_discovery_cls, \
+             patch('pymotivaxmc2.controller.SocketManager', return_value=AsyncMock()), \
+             patch('pymotivaxmc2.controller.Protocol', return_value=MagicMock()), \
+             patch('pymotivaxmc2.controller.Dispatcher', return_value=AsyncMock()):
+            mock_discovery = AsyncMock()
+            mock_discovery.fetch_transponder.return_value = mock_discovery_info
+            mock_discovery_cls.return_value = mock_discovery
+
+            await controller.connect()
+            await controller.disconnect()
+            await controller.connect(rediscover=False)
+            assert mock_discovery.fetch_transponder.await_count == 1
+
+            await controller.disconnect()
+            await controller.connect()
+            assert mock_discovery.fetch_transponder.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_connect_resolves_hostname_once(self, mock_discovery_info):
+        """A hostname is resolved once; discovery and sockets use the address."""
+        controller = EmotivaController("emotiva.local")
+        loop = asyncio.get_running_loop()
+        resolved = [(socket.AF_INET, socket.SOCK_DGRAM, 17, "", ("192.168.1.100", 0))]
+        with patch.object(loop, 'getaddrinfo', AsyncMock(return_value=resolved)) as mock_resolve, \
+             patch('pymotivaxmc2.controller.Discovery') as mock_discovery_cls, \
+             patch('pymotivaxmc2.controller.SocketManager', return_value=AsyncMock()) as mock_socket_mgr_cls, \
+             patch('pymotivaxmc2.controller.Protocol', return_value=MagicMock()), \
+             patch('pymotivaxmc2.controller.Dispatcher', return_value=AsyncMock()):
+            mock_discovery = AsyncMock()
+            mock_discovery.fetch_transponder.return_value = mock_discovery_info
+            mock_discovery_cls.return_value = mock_discovery
+
+            await controller.connect()
+            await controller.disconnect()
+            await controller.connect(rediscover=False)
+
+            mock_resolve.assert_awaited_once()
+            mock_discovery_cls.assert_called_once_with("192.168.1.100", timeout=controller.timeout)
+            assert mock_socket_mgr_cls.call_args.args[0] == "192.168.1.100"
+
+    @pytest.mark.asyncio
+    async def test_connect_unresolvable_host(self):
+        """An unresolvable hostname fails with DiscoveryError before any ping."""
+        controller = EmotivaController("no-such-host.invalid")
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, 'getaddrinfo', AsyncMock(side_effect=socket.gaierror("no name"))), \
+             patch('pymotivaxmc2.controller.Discovery') as mock_discovery_cls:
+            with pytest.raises(DiscoveryError):
+                await controller.connect()
+            mock_discovery_cls.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_connect_discovery_failure(self, controller):
         """Test connection failure during discovery."""
@@ -280,6 +336,22 @@ async def test_disconnect_not_connected(self):
         # Should handle gracefully
         await controller.disconnect()
 
+    @pytest.mark.asyncio
+    async def test_async_with_connects_and_disconnects(self):
+        """The controller connects on entry and disconnects on exit, even on error."""
+        controller = EmotivaController("192.168.1.100")
+
+        with patch.object(controller, "connect", new_callable=AsyncMock) as connect, \
+             patch.object(controller, "disconnect", new_callable=AsyncMock) as disconnect:
+            with pytest.raises(RuntimeError):
+                async with controller as ctrl:
+                    assert ctrl is controller
+                    connect.assert_awaited_once_with()
+                    disconnect.assert_not_awaited()
+                    raise RuntimeError("boom")
+
+        disconnect.assert_awaited_once_with()
+
 
 class TestSubscriptionMethods:
     """Test cases for subscription-related methods."""
@@ -341,7 +413,20 @@ def power_callback(value):
         
         connected_controller._dispatcher.on.assert_called_once_with(
             Property.POWER.value,
-            power_callback
+            power_callback,
+            inline=False
+        )
+
+    def test_on_decorator_inline(self, connected_controller):
+        """inline=True is passed through to the dispatcher."""
+        @connected_controller.on(Property.POWER, inline=True)
+        def power_callback(value):
+            pass
+
+        connected_controller._dispatcher.on.assert_called_once_with(
+            Property.POWER.value,
+            power_callback,
+            inline=True
         )
 
     def test_on_decorator_async_callback(self, connected_controller):
@@ -352,7 +437,8 @@ async def volume_callback(value):
         
         connected_controller._dispatcher.on.assert_called_once_with(
             Property.VOLUME.value,
-            volume_callback
+            volume_callback,
+            inline=False
         )
 
 
@@ -579,6 +665,22 @@ async def test_select_input_string(self, connected_controller):
             Command.HDMI2.value, retries=None, ack=True
         )
 
+    @pytest.mark.asyncio
+    async def test_select_input_string_case_insensitive(self, connected_controller):
+        """String inputs are matched case-insensitively to the connector command."""
+        await connected_controller.select_input("Optical3")
+
+        connected_controller._protocol.send_command.assert_called_once_with(
+            Command.OPTICAL3.value, retries=None, ack=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_select_input_unknown_string(self, connected_controller):
+        """An unknown input name raises InvalidArgumentError without sending."""
+        with pytest.raises(InvalidArgumentError):
+            await connected_controller.select_input("hdmi99")
+        connected_controller._protocol.send_command.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_select_source_int(self, connected_controller):
         """Selecting a logical source by Input number sends source_N."""
@@ -991,6 +1093,67 @@ async def test_socket_manager_stop_uses_lock(self):
         mock_transport.close.assert_called_once()
         assert len(socket_mgr._transports) == 0
 
+    @pytest.mark.asyncio
+    async def test_socket_manager_recv_ready_takes_queued_frames(self):
+        """recv_ready() returns the frames already queued, in order, without waiting."""
+        from pymotivaxmc2.core.socket_mgr import SocketManager
+
+        socket_mgr = SocketManager("192.168.1.100", {"notifyPort": 7003})
+        queue: asyncio.Queue = asyncio.Queue()
+        socket_mgr._queues[7003] = queue
+        assert socket_mgr.recv_ready("notifyPort") == []
+
+        queue.put_nowait((b"<a/>", ("192.168.1.100", 7003)))
+        queue.put_nowait((b"<b/>", ("192.168.1.100", 7003)))
+
+        assert socket_mgr.recv_ready("notifyPort") == [
+            (b"<a/>", ("192.168.1.100", 7003)),
+            (b"<b/>", ("192.168.1.100", 7003)),
+        ]
+        assert queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_socket_manager_recv_timeout(self):
+        """recv() raises TimeoutError when nothing arrives within the timeout."""
+        from pymotivaxmc2.core.socket_mgr import SocketManager
+
+        socket_mgr = SocketManager("192.168.1.100", {"controlPort": 7002})
+        queue: asyncio.Queue = asyncio.Queue()
+        socket_mgr._queues[7002] = queue
+
+        with pytest.raises(asyncio.TimeoutError):
+            await socket_mgr.recv("controlPort", timeout=0.01)
+
+        queue.put_nowait((b"<a/>", ("192.168.1.100", 7002)))
+        assert await socket_mgr.recv("controlPort", timeout=0.01) == (b"<a/>", ("192.168.1.100", 7002))
+
+    @pytest.mark.asyncio
+    async def test_socket_manager_frame_logging_gated_on_debug(self):
+        """Below DEBUG, received frames make no logging calls at all."""
+        from pymotivaxmc2.core import socket_mgr as socket_mgr_module
+        from pymotivaxmc2.core.socket_mgr import SocketManager
+
+        socket_mgr = SocketManager("192.168.1.100", {"notifyPort": 7003})
+        queue: asyncio.Queue = asyncio.Queue()
+        socket_mgr._queues[7003] = queue
+        frame = (b"<a/>", ("192.168.1.100", 7003))
+
+        with patch.object(socket_mgr_module, "log_xml") as log_xml, \
+             patch.object(socket_mgr_module._LOGGER, "debug") as debug, \
+             patch.object(socket_mgr_module._LOGGER, "isEnabledFor", return_value=False):
+            queue.put_nowait(frame)
+            assert await socket_mgr.recv("notifyPort") == frame
+            queue.put_nowait(frame)
+            assert socket_mgr.recv_ready("notifyPort") == [frame]
+        debug.assert_not_called()
+        log_xml.assert_not_called()
+
+        with patch.object(socket_mgr_module, "log_xml") as log_xml, \
+             patch.object(socket_mgr_module._LOGGER, "isEnabledFor", return_value=True):
+            queue.put_nowait(frame)
+            await socket_mgr.recv("notifyPort")
+        log_xml.assert_called_once_with(socket_mgr_module._LOGGER, "received", b"<a/>")
+
 
 # Phase 1 Tests: Dispatcher Callback Protection
 class TestPhase1DispatcherFixes:
@@ -1128,6 +1291,7 @@ class TestPhase2NetworkResilienceFixes:
     def protocol(self):
         """Create a protocol instance."""
         mock_socket_mgr = AsyncMock()
+        mock_socket_mgr.drain = MagicMock(return_value=0)  # drain() is sync on the real SocketManager
         return Protocol(mock_socket_mgr, protocol_version="3.1", ack_timeout=1.0)
 
     def test_protocol_serializes_control_port(self, protocol):
@@ -1157,7 +1321,7 @@ async def test_send_command_retry_on_timeout(self, protocol):
         def timeout_then_succeed(*args, **kwargs):
             nonlocal call_count
             call_count += 1
-            if call_count < 3:  # Fail first 2 attempts
+            if call_count < 5:  # Fail first 2 attempts and their silent backoff windows
                 raise asyncio.TimeoutError()
             else:  # Succeed on 3rd attempt
                 mock_xml = MagicMock()
@@ -1175,7 +1339,7 @@ def timeout_then_succeed(*args, **kwargs):
             result = await protocol.send_command("power_on")
             
             # Should have retried and succeeded
-            assert call_count == 3
+            assert call_count == 5
             assert result.tag == "emotivaAck"
             
             # Should have sent command multiple times
@@ -1246,10 +1410,10 @@ def track_send_calls(*args, **kwargs):
         protocol.socket_mgr.send.side_effect = track_send_calls
         
         # Test exception-based retry (simpler than timeout handling)
-        protocol.socket_mgr.recv.side_effect = Exception("Network error")
+        protocol.socket_mgr.recv.side_effect = OSError("Network error")
         
         # Should raise exception after retries
-        with pytest.raises(Exception):
+        with pytest.raises(OSError):
             await protocol.request_properties(["power"], timeout=0.1)
         
         # Should have retried (sent multiple times)
@@ -1357,6 +1521,53 @@ async def mock_endpoint_creation(*args, **kwargs):
                     assert result["model"] == "Test"
 
 
+    @pytest.mark.asyncio
+    async def test_late_reply_during_backoff_completes_discovery(self, discovery):
+        """A reply arriving after the attempt timed out still ends discovery."""
+        discovery.timeout = 0.05
+        loop = asyncio.get_running_loop()
+        transport = MagicMock()
+        reply = b"<emotivaTransponder><model>XMC-2</model></emotivaTransponder>"
+
+        async def endpoint(factory, **kwargs):
+            proto = factory()
+            # The device answers the first ping, but only after its timeout
+            loop.call_later(0.1, proto.datagram_received, reply, ("192.168.1.100", 7000))
+            return transport, proto
+
+        with patch.object(loop, 'create_datagram_endpoint', side_effect=endpoint) as mock_endpoint:
+            result = await discovery.fetch_transponder()
+
+        assert result["model"] == "XMC-2"
+        mock_endpoint.assert_called_once()
+        transport.sendto.assert_called_once()
+        transport.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_transponder_protocol_is_one_module_level_class(self, discovery):
+        """Every discovery uses the same protocol class; foreign replies are ignored."""
+        from pymotivaxmc2.core.discovery import _TransponderProto
+
+        loop = asyncio.get_running_loop()
+        reply = b"<emotivaTransponder><model>XMC-2</model></emotivaTransponder>"
+        protos = []
+
+        async def endpoint(factory, **kwargs):
+            proto = factory()
+            protos.append(proto)
+            proto.datagram_received(b"<noise/>", ("192.168.1.99", 7000))
+            proto.datagram_received(reply, ("192.168.1.100", 7000))
+            return MagicMock(), proto
+
+        with patch.object(loop, 'create_datagram_endpoint', side_effect=endpoint):
+            await discovery.fetch_transponder()
+            result = await discovery.fetch_transponder()
+
+        assert result["model"] == "XMC-2"
+        assert [type(p) for p in protos] == [_TransponderProto, _TransponderProto]
+        assert not hasattr(protos[0], "__dict__")
+
+
 class TestPhase2ErrorHandlingImprovements:
     """Test cases for Phase 2 error handling improvements."""
 
@@ -1382,6 +1593,7 @@ async def test_protocol_error_categorization(self):
         from pymotivaxmc2.core.protocol import Protocol
         
         mock_socket_mgr = AsyncMock()
+        mock_socket_mgr.drain = MagicMock(return_value=0)  # drain() is sync on the real SocketManager
         protocol = Protocol(mock_socket_mgr, ack_timeout=0.1)
         protocol._max_retries = 1  # Quick test
         protocol._base_backoff = 0.01
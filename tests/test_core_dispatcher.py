@@ -3,6 +3,7 @@
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 import xml.etree.ElementTree as ET
+from collections import deque
 
 from pymotivaxmc2.core.dispatcher import Dispatcher
 
@@ -70,6 +71,88 @@ def callback2(value):
         assert callback1 in dispatcher._listeners["power"]
         assert callback2 in dispatcher._listeners["power"]
 
+    def test_register_compiles_route(self):
+        """Registration precomputes the (callback, kind) route per property."""
+        from pymotivaxmc2.core.dispatcher import _AWAIT, _CALL_INLINE, _RUN_IN_EXECUTOR
+        dispatcher = Dispatcher(AsyncMock(), "notifyPort")
+
+        def sync_cb(value):
+            pass
+
+        async def async_cb(value):
+            pass
+
+        dispatcher.on("power", sync_cb)
+        dispatcher.on("power", async_cb)
+        dispatcher.on("power", sync_cb, inline=True)
+
+        assert dispatcher._routes["power"] == (
+            (sync_cb, _RUN_IN_EXECUTOR), (async_cb, _AWAIT), (sync_cb, _CALL_INLINE))
+        assert "volume" not in dispatcher._routes
+
+    def test_inline_rejects_async_callbacks(self):
+        """inline=True is only meaningful for sync callbacks."""
+        dispatcher = Dispatcher(AsyncMock(), "notifyPort")
+
+        async def async_cb(value):
+            pass
+
+        with pytest.raises(ValueError):
+            dispatcher.on("power", async_cb, inline=True)
+        assert "power" not in dispatcher._routes
+
+    @pytest.mark.asyncio
+    async def test_incremental_registration_keeps_each_callback_kind(self):
+        """Callbacks added one by one are each still invoked their own way:
+        sync ones in the executor, async ones awaited on the loop."""
+        import threading
+        dispatcher = Dispatcher(AsyncMock(), "notifyPort")
+        loop_thread = threading.current_thread()
+        calls = set()
+
+        def sync_a(value):
+            calls.add(("sync_a", value, threading.current_thread() is loop_thread))
+
+        async def async_b(value):
+            await asyncio.sleep(0)
+            calls.add(("async_b", value, threading.current_thread() is loop_thread))
+
+        def sync_c(value):
+            calls.add(("sync_c", value, threading.current_thread() is loop_thread))
+
+        dispatcher.on("power", sync_a)
+        await dispatcher.dispatch("power", "On")
+        dispatcher.on("power", async_b)
+        dispatcher.on("power", sync_c)
+        await dispatcher.dispatch("power", "Off")
+        await asyncio.gather(*dispatcher._active_tasks)
+
+        assert calls == {
+            ("sync_a", "On", False),
+            ("sync_a", "Off", False),
+            ("async_b", "Off", True),
+            ("sync_c", "Off", False),
+        }
+
+    @pytest.mark.asyncio
+    async def test_runtime_built_and_enum_names_route_notifications(self):
+        """Names built at runtime and Property members both receive notified values."""
+        from pymotivaxmc2.enums import Property
+        mock_socket_mgr = AsyncMock()
+        dispatcher = Dispatcher(mock_socket_mgr, "notifyPort")
+        received = []
+        dispatcher.on("".join(["input", "_", "3"]), lambda value: received.append(("input_3", value)))
+        dispatcher.on(Property.VOLUME, lambda value: received.append(("volume", value)))
+        frame = (b'<emotivaNotify sequence="1"><property name="input_3" value="Apple TV"/>'
+                 b'<property name="volume" value="-30.0"/></emotivaNotify>')
+        mock_socket_mgr.recv.side_effect = [(frame, None), asyncio.CancelledError()]
+        mock_socket_mgr.recv_ready = MagicMock(return_value=[])
+
+        with pytest.raises(asyncio.CancelledError):
+            await dispatcher._run()
+
+        assert received == [("input_3", "Apple TV"), ("volume", "-30.0")]
+
 
 class TestPublicDispatchAPI:
     """Test the public has_listeners / dispatch helpers used for fan-out."""
@@ -429,6 +512,145 @@ async def async_callback(value):
         assert async_value == "-30.0"
 
 
+    @pytest.mark.asyncio
+    async def test_frame_sync_callbacks_share_one_executor_job(self):
+        """A frame's sync callbacks run in a single executor hop; errors are contained."""
+        dispatcher = Dispatcher(AsyncMock(), "notifyPort")
+        received = []
+
+        def broken(value):
+            raise RuntimeError("boom")
+
+        dispatcher.on("power", broken)
+        dispatcher.on("power", lambda value: received.append(("power", value)))
+        dispatcher.on("volume", lambda value: received.append(("volume", value)))
+
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "run_in_executor", wraps=loop.run_in_executor) as spy:
+            await dispatcher._dispatch_properties({"power": "On", "volume": "-20.0"})
+
+        assert spy.call_count == 1
+        assert received == [("power", "On"), ("volume", "-20.0")]
+
+
+    @pytest.mark.asyncio
+    async def test_inline_sync_callbacks_skip_the_executor(self):
+        """Inline callbacks run during dispatch, errors contained, with no executor job."""
+        dispatcher = Dispatcher(AsyncMock(), "notifyPort")
+        received = []
+
+        def broken(value):
+            raise RuntimeError("boom")
+
+        dispatcher.on("volume", broken, inline=True)
+        dispatcher.on("volume", received.append, inline=True)
+
+        with patch("pymotivaxmc2.core.dispatcher._run_sync_callbacks") as run_sync:
+            await dispatcher._dispatch_frames(({"volume": "-30.0"}, {"volume": "-29.0"}))
+
+        run_sync.assert_not_called()
+        assert received == ["-30.0", "-29.0"]
+
+    @pytest.mark.asyncio
+    async def test_async_callbacks_drained_in_order_by_one_task(self):
+        """Async callbacks share one drain task and see values in arrival order."""
+        dispatcher = Dispatcher(AsyncMock(), "notifyPort")
+        received = []
+
+        async def on_volume(value):
+            await asyncio.sleep(0)
+            received.append(value)
+
+        dispatcher.on("volume", on_volume)
+        for value in ("-30.0", "-29.0", "-28.0"):
+            await dispatcher._dispatch_property("volume", value)
+
+        assert len(dispatcher._active_tasks) == 1
+        await asyncio.gather(*dispatcher._active_tasks)
+        assert received == ["-30.0", "-29.0", "-28.0"]
+        assert not dispatcher._pending
+
+    @pytest.mark.asyncio
+    async def test_pending_callbacks_drop_oldest_on_overflow(self):
+        """The pending queue is bounded and keeps the newest invocations."""
+        dispatcher = Dispatcher(AsyncMock(), "notifyPort")
+        dispatcher._pending = deque(maxlen=2)
+        received = []
+
+        async def on_volume(value):
+            received.append(value)
+
+        dispatcher.on("volume", on_volume)
+        # A lazily started drain leaves the invocations queued until it runs
+        # (an eager one, on 3.12+, would deliver each before the next arrives).
+        with patch("pymotivaxmc2.core.dispatcher._eager_task_factory", None):
+            await dispatcher._dispatch_properties({"volume": "-30.0"})
+            await dispatcher._dispatch_properties({"volume": "-29.0"})
+            await dispatcher._dispatch_properties({"volume": "-28.0"})
+
+        await asyncio.gather(*dispatcher._active_tasks)
+        assert received == ["-29.0", "-28.0"]
+
+    @pytest.mark.asyncio
+    async def test_overflow_logs_one_warning_per_batch(self):
+        """A burst that overflows the queue is reported once, with the drop count."""
+        dispatcher = Dispatcher(AsyncMock(), "notifyPort")
+        dispatcher._pending = deque(maxlen=2)
+
+        async def on_volume(value):
+            pass
+
+        dispatcher.on("volume", on_volume)
+        frames = [{"volume": str(-30.0 + i)} for i in range(6)]
+        with patch("pymotivaxmc2.core.dispatcher._eager_task_factory", None), \
+             patch("pymotivaxmc2.core.dispatcher._LOGGER") as logger:
+            logger.isEnabledFor.return_value = False
+            await dispatcher._dispatch_frames(frames)
+
+        logger.warning.assert_called_once()
+        assert logger.warning.call_args.args[1:] == (2, 4)
+        await asyncio.gather(*dispatcher._active_tasks)
+
+    @pytest.mark.asyncio
+    async def test_drain_task_started_eagerly_when_supported(self):
+        """Where asyncio offers eager_task_factory, the drain task uses it."""
+        dispatcher = Dispatcher(AsyncMock(), "notifyPort")
+        received = []
+
+        async def on_volume(value):
+            received.append(value)
+
+        dispatcher.on("volume", on_volume)
+        factory = MagicMock(side_effect=lambda loop, coro: loop.create_task(coro))
+        with patch("pymotivaxmc2.core.dispatcher._eager_task_factory", factory):
+            await dispatcher._dispatch_properties({"volume": "-30.0"})
+
+        factory.assert_called_once()
+        await asyncio.gather(*dispatcher._active_tasks)
+        assert received == ["-30.0"]
+        assert dispatcher._draining is False
+
+    @pytest.mark.asyncio
+    async def test_slow_async_callback_times_out_and_drain_continues(self):
+        """A callback past its deadline is abandoned; the next one still runs."""
+        dispatcher = Dispatcher(AsyncMock(), "notifyPort")
+        dispatcher._callback_timeout = 0.01
+        received = []
+
+        async def stuck(value):
+            await asyncio.sleep(10)
+
+        async def on_volume(value):
+            received.append(value)
+
+        dispatcher.on("volume", stuck)
+        dispatcher.on("volume", on_volume)
+        await dispatcher._dispatch_properties({"volume": "-30.0"})
+
+        await asyncio.wait_for(asyncio.gather(*dispatcher._active_tasks), timeout=1.0)
+        assert received == ["-30.0"]
+
+
 class TestDispatcherLifecycle:
     """Test dispatcher start/stop functionality."""
     
@@ -615,6 +837,7 @@ async def feed(port):
             raise _asyncio.CancelledError()
 
         mock_socket_mgr.recv.side_effect = feed
+        mock_socket_mgr.recv_ready = MagicMock(return_value=[])
 
         await dispatcher.start()
         # Wait for the feed to be consumed (the run loop cancels itself via feed)
@@ -631,3 +854,167 @@ async def feed(port):
     def test_initial_state(self, dispatcher):
         assert dispatcher.last_sequence is None
         assert dispatcher.gap_count == 0
+
+    @pytest.mark.asyncio
+    async def test_run_tracks_sequence_and_dispatches(self, dispatcher, mock_socket_mgr):
+        """The notify loop records a frame's sequence and fans out its values."""
+        received = []
+        dispatcher.on("power", lambda value: received.append(value))
+        mock_socket_mgr.recv.side_effect = [(self._notify(3), None), asyncio.CancelledError()]
+        mock_socket_mgr.recv_ready = MagicMock(return_value=[])
+
+        with pytest.raises(asyncio.CancelledError):
+            await dispatcher._run()
+
+        assert dispatcher.last_sequence == 3
+        assert received == ["On"]
+
+    def test_no_listeners_tracks_sequence_without_extracting(self, dispatcher):
+        """With nothing registered a frame only updates the sequence."""
+        with patch.object(dispatcher, "_extract_properties") as extract:
+            assert dispatcher._frame_properties(self._notify(4)) == {}
+
+        extract.assert_not_called()
+        assert dispatcher.last_sequence == 4
+
+    @pytest.mark.parametrize("frame", [
+        b'<emotivaNotify sequence="5"><power>On</power><volume>-30.0</volume>'
+        b'<mode>Stereo</mode></emotivaNotify>',
+        b'<emotivaNotify sequence="5"><property name="power" value="On"/>'
+        b'<property name="volume" value="-30.0"/><property name="mode" value="Stereo"/>'
+        b'</emotivaNotify>',
+    ])
+    def test_only_routed_properties_are_extracted(self, dispatcher, frame):
+        """Properties without a callback are skipped during extraction, in both formats."""
+        dispatcher.on("volume", lambda value: None)
+
+        assert dispatcher._frame_properties(frame) == {"volume": "-30.0"}
+        assert dispatcher.last_sequence == 5
+
+
+class TestUnhandledFrames:
+    """Menu / bar notifications are dropped on their raw bytes, never parsed."""
+
+    @pytest.mark.asyncio
+    async def test_menu_and_bar_frames_skip_the_parser(self):
+        from pymotivaxmc2.core.xmlcodec import parse_xml
+        mock_socket_mgr = AsyncMock()
+        dispatcher = Dispatcher(mock_socket_mgr, "notifyPort")
+        received = []
+        dispatcher.on("power", lambda value: received.append(value))
+        frames = [
+            b'<?xml version="1.0"?>\n<emotivaMenuNotify sequence="1"><row number="0"/></emotivaMenuNotify>',
+            b'<emotivaBarNotify sequence="2"><bar type="off"/></emotivaBarNotify>',
+            b'<emotivaNotify sequence="3"><power>On</power></emotivaNotify>',
+        ]
+
+        async def feed(port):
+            if frames:
+                return (frames.pop(0), None)
+            raise asyncio.CancelledError()
+
+        mock_socket_mgr.recv.side_effect = feed
+        mock_socket_mgr.recv_ready = MagicMock(return_value=[])
+
+        with patch("pymotivaxmc2.core.dispatcher.parse_xml", wraps=parse_xml) as parse:
+            with pytest.raises(asyncio.CancelledError):
+                await dispatcher._run()
+
+        assert parse.call_count == 1
+        assert received == ["On"]
+
+
+class TestBurstCoalescing:
+    """Frames already queued behind the one that woke the loop form one batch."""
+
+    @pytest.mark.asyncio
+    async def test_queued_frames_share_one_executor_job(self):
+        from pymotivaxmc2.core.dispatcher import _run_sync_callbacks
+        mock_socket_mgr = AsyncMock()
+        dispatcher = Dispatcher(mock_socket_mgr, "notifyPort")
+        received = []
+        dispatcher.on("volume", lambda value: received.append(value))
+        first = b'<emotivaNotify sequence="1"><volume>-30.0</volume></emotivaNotify>'
+        queued = [
+            (b'<emotivaNotify sequence="2"><volume>-29.0</volume></emotivaNotify>', None),
+            (b'<not-xml', None),
+            (b'<emotivaNotify sequence="3"><volume>-28.0</volume></emotivaNotify>', None),
+        ]
+        mock_socket_mgr.recv.side_effect = [(first, None), asyncio.CancelledError()]
+        mock_socket_mgr.recv_ready = MagicMock(return_value=queued)
+
+        with patch("pymotivaxmc2.core.dispatcher._run_sync_callbacks",
+                   wraps=_run_sync_callbacks) as run_sync:
+            with pytest.raises(asyncio.CancelledError):
+                await dispatcher._run()
+
+        run_sync.assert_called_once()
+        assert received == ["-30.0", "-29.0", "-28.0"]
+        assert dispatcher.last_sequence == 3
+
+    @pytest.mark.asyncio
+    async def test_socket_manager_without_recv_ready_dispatches_each_frame(self):
+        """recv_ready is optional: without it every frame is still delivered."""
+        class RecvOnly:
+            def __init__(self, frames):
+                self._frames = frames
+
+            async def recv(self, port_name):
+                if self._frames:
+                    return (self._frames.pop(0), None)
+                raise asyncio.CancelledError()
+
+        socket_mgr = RecvOnly([
+            b'<emotivaNotify sequence="1"><volume>-30.0</volume></emotivaNotify>',
+            b'<emotivaNotify sequence="2"><volume>-29.0</volume></emotivaNotify>',
+        ])
+        dispatcher = Dispatcher(socket_mgr, "notifyPort")
+        received = []
+        dispatcher.on("volume", lambda value: received.append(value))
+
+        with pytest.raises(asyncio.CancelledError):
+            await dispatcher._run()
+
+        assert received == ["-30.0", "-29.0"]
+        assert dispatcher.last_sequence == 2
+
+
+class TestChangesOnly:
+    """changes_only drops repeats of a property's last value before dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_values_are_not_dispatched(self):
+        dispatcher = Dispatcher(AsyncMock(), "notifyPort", changes_only=True)
+        received = []
+
+        async def on_volume(value):
+            received.append(value)
+
+        dispatcher.on("volume", on_volume)
+        # Subscribe-time values seed the cache like notifications do
+        await dispatcher.dispatch_many({"volume": "-30.0", "power": "On"})
+        await dispatcher._dispatch_frames((
+            {"volume": "-30.0", "power": "On"},
+            {"volume": "-29.0"},
+            {"volume": "-29.0"},
+            {"volume": "-30.0"},
+        ))
+        await asyncio.gather(*dispatcher._active_tasks)
+
+        assert received == ["-30.0", "-29.0", "-30.0"]
+        assert dispatcher._last_values == {"volume": "-30.0", "power": "On"}
+
+    @pytest.mark.asyncio
+    async def test_repeats_dispatched_by_default(self):
+        dispatcher = Dispatcher(AsyncMock(), "notifyPort")
+        received = []
+
+        async def on_volume(value):
+            received.append(value)
+
+        dispatcher.on("volume", on_volume)
+        await dispatcher._dispatch_frames(({"volume": "-30.0"}, {"volume": "-30.0"}))
+        await asyncio.gather(*dispatcher._active_tasks)
+
+        assert received == ["-30.0", "-30.0"]
+        assert dispatcher._last_values == {}
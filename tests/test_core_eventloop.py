@@ -0,0 +1,30 @@
+"""Test cases for pymotivaxmc2.core.eventloop module."""
+
+import asyncio
+import sys
+from unittest.mock import MagicMock, patch
+
+from pymotivaxmc2.core import eventloop
+from pymotivaxmc2.core.eventloop import fast_loop_factory
+
+
+class TestFastLoopFactory:
+    """Test cases for fast_loop_factory function."""
+
+    def test_falls_back_to_asyncio(self):
+        """Without the fast loop installed, the stock asyncio factory is returned."""
+        with patch.dict(sys.modules, {eventloop._FAST_LOOP_MODULE: None}):
+            assert fast_loop_factory() is asyncio.new_event_loop
+
+    def test_prefers_fast_loop_when_installed(self):
+        """The installed module's new_event_loop is returned, not called."""
+        fake_loop_module = MagicMock()
+        with patch.dict(sys.modules, {eventloop._FAST_LOOP_MODULE: fake_loop_module}):
+            assert fast_loop_factory() is fake_loop_module.new_event_loop
+        fake_loop_module.new_event_loop.assert_not_called()
+
+    def test_factory_drives_a_runner(self):
+        """The returned factory is usable as an asyncio.Runner loop_factory."""
+        with patch.dict(sys.modules, {eventloop._FAST_LOOP_MODULE: None}):
+            with asyncio.Runner(loop_factory=fast_loop_factory()) as runner:
+                assert runner.run(asyncio.sleep(0, result="ok")) == "ok"
@@ -34,6 +34,14 @@ def test_init_custom_values(self):
         assert protocol.protocol_version == "3.1"
         assert protocol.ack_timeout == 5.0
 
+    def test_reply_dialect_cached_from_version(self):
+        """The 2.0 / 3.0+ reply dialect is resolved when the version is set."""
+        protocol = Protocol(MagicMock(), protocol_version="3.1")
+        assert protocol._named_properties is True
+
+        protocol.protocol_version = "2.0"
+        assert protocol._named_properties is False
+
 
 class TestSendCommand:
     """Test cases for Protocol.send_command method."""
@@ -187,6 +195,22 @@ async def test_request_properties_v3_success(self, protocol_v3, mock_socket_mgr)
         
         assert result == {"power": "On", "volume": "-20.5"}
 
+    @pytest.mark.asyncio
+    async def test_request_properties_repeated_names_finish_on_reply(self, protocol_v3, mock_socket_mgr):
+        """A request naming a property twice completes on the first full reply."""
+        notify_xml = b'''<?xml version="1.0"?>
+        <emotivaUpdate>
+            <property name="power" value="On"/>
+            <property name="volume" value="-20.5"/>
+        </emotivaUpdate>'''
+        mock_socket_mgr.recv.return_value = (notify_xml, None)
+
+        result = await protocol_v3.request_properties(["power", "volume", "power"], timeout=1.0)
+
+        assert result == {"power": "On", "volume": "-20.5"}
+        mock_socket_mgr.send.assert_called_once()
+        mock_socket_mgr.recv.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_request_properties_timeout(self, protocol_v2, mock_socket_mgr):
         """Test property request with timeout."""
@@ -214,8 +238,10 @@ async def test_request_properties_partial_response(self, protocol_v2, mock_socke
         mock_socket_mgr.recv.side_effect = [
             (notify_xml, None),          # First response with partial data
             asyncio.TimeoutError(),      # Timeout waiting for more properties (attempt 1)
+            asyncio.TimeoutError(),      # Nothing late during the backoff
             (notify_xml, None),          # Retry 1: same partial response  
             asyncio.TimeoutError(),      # Timeout waiting for more properties (retry 1)
+            asyncio.TimeoutError(),      # Nothing late during the backoff
             (notify_xml, None),          # Retry 2: same partial response
             asyncio.TimeoutError(),      # Timeout waiting for more properties (retry 2)
         ]
@@ -257,7 +283,9 @@ class TestRequestPropertiesFull:
 
     @pytest.fixture
     def mock_socket_mgr(self):
-        return AsyncMock()
+        mock = AsyncMock()
+        mock.drain = MagicMock(return_value=0)  # drain() is sync on the real SocketManager
+        return mock
 
     @pytest.fixture
     def protocol_v3(self, mock_socket_mgr):
@@ -400,6 +428,21 @@ async def test_subscribe_timeout(self, protocol_v2, mock_socket_mgr):
         
         assert "No subscription confirmation received" in str(excinfo.value)
 
+    @pytest.mark.asyncio
+    async def test_subscribe_retries_resend_one_payload(self, protocol_v2, mock_socket_mgr):
+        """The request is serialized once; every retry re-sends those bytes."""
+        protocol_v2._base_backoff = 0.001
+        mock_socket_mgr.recv.side_effect = asyncio.TimeoutError()
+
+        with patch("pymotivaxmc2.core.protocol.build_subscribe",
+                   return_value=b"<emotivaSubscription/>") as build:
+            with pytest.raises(AckTimeoutError):
+                await protocol_v2.subscribe(["power"], retries=2)
+
+        build.assert_called_once_with(["power"], "2.0")
+        payloads = [c.args[0] for c in mock_socket_mgr.send.call_args_list]
+        assert payloads == [b"<emotivaSubscription/>"] * 3
+
     @pytest.mark.asyncio
     async def test_subscribe_stale_frame_discarded(self, protocol_v2, mock_socket_mgr):
         """A stale frame while waiting for the subscription confirmation is
@@ -431,7 +474,9 @@ class TestSubscribeInitialDispatch:
 
     @pytest.fixture
     def mock_socket_mgr(self):
-        return AsyncMock()
+        mock = AsyncMock()
+        mock.drain = MagicMock(return_value=0)  # drain() is sync on the real SocketManager
+        return mock
 
     @pytest.fixture
     def protocol_v3(self, mock_socket_mgr):
@@ -533,6 +578,26 @@ def good_cb(value):
         # The unrelated good callback still fired.
         assert good_received == ["-20.5"]
 
+    @pytest.mark.asyncio
+    async def test_initial_values_fan_out_as_one_frame(self, protocol_v3, mock_socket_mgr):
+        """All initial values with listeners are dispatched in a single call."""
+        dispatcher = self._wire_dispatcher(protocol_v3, mock_socket_mgr)
+        dispatcher.on("power", lambda value: None)
+        dispatcher.on("volume", lambda value: None)
+
+        sub_xml = b'''<?xml version="1.0"?>
+        <emotivaSubscription>
+            <property name="power" status="ack" value="On" visible="true"/>
+            <property name="volume" status="ack" value="-20.5" visible="true"/>
+            <property name="mute" status="ack" value="Off" visible="true"/>
+        </emotivaSubscription>'''
+        mock_socket_mgr.recv.return_value = (sub_xml, None)
+
+        with patch.object(dispatcher, "dispatch_many", AsyncMock()) as dispatch_many:
+            await protocol_v3.subscribe(["power", "volume", "mute"])
+
+        dispatch_many.assert_awaited_once_with({"power": "On", "volume": "-20.5"})
+
     @pytest.mark.asyncio
     async def test_property_without_callback_goes_into_return_only(
         self, protocol_v3, mock_socket_mgr
@@ -623,6 +688,38 @@ async def test_protocol_error_handling(self, mock_socket_mgr):
         
         assert "Network error" in str(excinfo.value) 
 
+    @pytest.mark.asyncio
+    async def test_garbled_reply_is_retried(self, mock_socket_mgr):
+        """A reply that fails to parse costs an attempt, not the command."""
+        protocol = Protocol(mock_socket_mgr, ack_timeout=0.5)
+        protocol._base_backoff = 0.01
+        mock_socket_mgr.recv.side_effect = [
+            (b"<emotivaAck", None),
+            (b'<?xml version="1.0"?><emotivaAck/>', None),
+        ]
+
+        xml = await protocol.send_command("power_on")
+
+        assert xml.tag == "emotivaAck"
+        assert mock_socket_mgr.send.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_non_transport_error_is_not_retried(self, mock_socket_mgr):
+        """Errors that are not network or parse failures propagate on the first attempt."""
+        protocol = Protocol(mock_socket_mgr, ack_timeout=0.5)
+        mock_socket_mgr.recv.side_effect = KeyError("controlPort")
+
+        with patch("pymotivaxmc2.core.protocol.asyncio.sleep") as sleep:
+            with pytest.raises(KeyError):
+                await protocol.send_command("power_on")
+            with pytest.raises(KeyError):
+                await protocol.request_properties(["power"])
+            with pytest.raises(KeyError):
+                await protocol.subscribe(["power"])
+
+        assert mock_socket_mgr.send.await_count == 3
+        sleep.assert_not_called()
+
 class TestControlPortSerialization:
     """LIB-1 (bridge ledger): one control-port transaction in flight at a time."""
 
@@ -691,6 +788,119 @@ async def test_update_transaction_drains_and_serializes(self, protocol, mock_soc
         mock_socket_mgr.drain.assert_called_with("controlPort")
         assert protocol._control_lock.locked() is False  # released after the transaction
 
+    @pytest.mark.asyncio
+    async def test_queued_reads_coalesce_into_one_update(self, protocol, mock_socket_mgr):
+        """Status reads waiting behind another transaction go out as ONE Update
+        for the union of their names; each caller gets only what it asked for."""
+        sent: list[bytes] = []
+        ack_xml = b'<?xml version="1.0"?><emotivaAck/>'
+        update_xml = (
+            b'<?xml version="1.0"?><emotivaUpdate protocol="3.1">'
+            b'<property name="power" value="On" visible="true" status="ack"/>'
+            b'<property name="volume" value="-30.0" visible="true" status="ack"/>'
+            b'<property name="mode" value="Stereo" visible="true" status="ack"/>'
+            b'</emotivaUpdate>'
+        )
+
+        async def fake_send(data, port):
+            sent.append(data)
+
+        async def fake_recv(port, timeout=None):
+            await asyncio.sleep(0.01)  # the command holds the lock meanwhile
+            return (update_xml if b"emotivaUpdate" in sent[-1] else ack_xml, None)
+
+        mock_socket_mgr.send.side_effect = fake_send
+        mock_socket_mgr.recv.side_effect = fake_recv
+
+        _, first, second = await asyncio.gather(
+            protocol.send_command("power_on"),
+            protocol.request_properties_full(["power", "volume"], timeout=0.5),
+            protocol.request_properties_full(["volume", "mode"], timeout=0.5),
+        )
+
+        updates = [data for data in sent if b"emotivaUpdate" in data]
+        assert len(updates) == 1
+        assert all(name in updates[0] for name in (b"power", b"volume", b"mode"))
+        assert list(first) == ["power", "volume"]
+        assert list(second) == ["volume", "mode"]
+        assert second["mode"]["value"] == "Stereo"
+        assert protocol._read_batch is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_leader_does_not_strand_joiners(self, protocol, mock_socket_mgr):
+        """A read that joined a batch whose leader is cancelled sends its own request."""
+        ack_xml = b'<?xml version="1.0"?><emotivaAck/>'
+        update_xml = (
+            b'<?xml version="1.0"?><emotivaUpdate protocol="3.1">'
+            b'<property name="mode" value="Stereo" visible="true" status="ack"/>'
+            b'</emotivaUpdate>'
+        )
+        release = asyncio.Event()
+
+        async def fake_recv(port, timeout=None):
+            if not release.is_set():
+                await release.wait()
+                return (ack_xml, None)
+            return (update_xml, None)
+
+        mock_socket_mgr.recv.side_effect = fake_recv
+
+        command = asyncio.create_task(protocol.send_command("power_on"))
+        await asyncio.sleep(0)
+        leader = asyncio.create_task(protocol.request_properties_full(["power"], timeout=0.5))
+        await asyncio.sleep(0)
+        joiner = asyncio.create_task(protocol.request_properties_full(["mode"], timeout=0.5))
+        await asyncio.sleep(0)
+        leader.cancel()
+        release.set()
+
+        await command
+        assert (await joiner)["mode"]["value"] == "Stereo"
+        assert leader.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_after_joiner_cancelled_logs_nothing(self, protocol, mock_socket_mgr):
+        """A leader failing after its only joiner was cancelled leaves no
+        'Future exception was never retrieved' behind."""
+        import gc
+        loop = asyncio.get_running_loop()
+        errors: list[dict] = []
+        loop.set_exception_handler(lambda loop, context: errors.append(context))
+        release = asyncio.Event()
+
+        async def fake_send(data, port):
+            if b"emotivaUpdate" in data:
+                raise RuntimeError("not retryable")
+
+        async def fake_recv(port, timeout=None):
+            await release.wait()
+            return (b'<?xml version="1.0"?><emotivaAck/>', None)
+
+        mock_socket_mgr.send.side_effect = fake_send
+        mock_socket_mgr.recv.side_effect = fake_recv
+
+        try:
+            command = asyncio.create_task(protocol.send_command("power_on"))
+            await asyncio.sleep(0)
+            leader = asyncio.create_task(protocol.request_properties_full(["power"], timeout=0.5))
+            await asyncio.sleep(0)
+            joiner = asyncio.create_task(protocol.request_properties_full(["mode"], timeout=0.5))
+            await asyncio.sleep(0)
+            joiner.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await joiner
+            release.set()
+
+            await command
+            with pytest.raises(RuntimeError):
+                await leader
+            del leader, joiner
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+
+        assert errors == []
+
 
 class TestRetryDampingAndPacing:
     """LIB-2 (bridge ledger): per-call retries, ack='no', pacing, missing-only batch retry."""
@@ -762,6 +972,17 @@ async def fake_send(data, port):
         assert len(send_times) == 2
         assert send_times[1] - send_times[0] >= 0.08
 
+    @pytest.mark.asyncio
+    async def test_unpaced_sends_take_no_timestamp(self, protocol, mock_socket_mgr):
+        """Without min_send_interval no send timestamp is recorded."""
+        mock_socket_mgr.recv.return_value = (b'<?xml version="1.0"?><emotivaAck/>', None)
+
+        await protocol.send_command("power_on")
+        await protocol.send_command("power_off")
+
+        assert mock_socket_mgr.send.await_count == 2
+        assert protocol._last_send_monotonic is None
+
     @pytest.mark.asyncio
     async def test_batch_retry_requests_only_missing(self, mock_socket_mgr):
         """A partial Update response retries ONLY the missing properties —
@@ -777,9 +998,10 @@ async def test_batch_retry_requests_only_missing(self, mock_socket_mgr):
             b'<property name="volume" value="-40.0" visible="true" status="ack"/>'
             b'</emotivaUpdate>'
         )
-        # attempt 1: partial answer then silence; attempt 2: the missing one
+        # attempt 1: partial answer then silence (also through the backoff);
+        # attempt 2: the missing one
         mock_socket_mgr.recv.side_effect = [
-            (partial, None), asyncio.TimeoutError(),
+            (partial, None), asyncio.TimeoutError(), asyncio.TimeoutError(),
             (complete, None),
         ]
 
@@ -793,3 +1015,80 @@ async def test_batch_retry_requests_only_missing(self, mock_socket_mgr):
         second_update = mock_socket_mgr.send.call_args_list[1][0][0]
         assert b"volume" in second_update
         assert b"power" not in second_update  # missing-only re-request
+
+    @pytest.mark.asyncio
+    async def test_late_reply_during_backoff_completes_without_resend(self, mock_socket_mgr):
+        """A reply that misses the attempt's window but lands during the backoff
+        completes the read; nothing is re-sent to the device."""
+        protocol = Protocol(mock_socket_mgr, protocol_version="3.1", ack_timeout=0.5)
+        protocol._base_backoff = 0.05
+        partial = (
+            b'<?xml version="1.0"?><emotivaUpdate protocol="3.1">'
+            b'<property name="power" value="On" visible="true" status="ack"/>'
+            b'</emotivaUpdate>'
+        )
+        late = (
+            b'<?xml version="1.0"?><emotivaUpdate protocol="3.1">'
+            b'<property name="volume" value="-40.0" visible="true" status="ack"/>'
+            b'</emotivaUpdate>'
+        )
+        mock_socket_mgr.recv.side_effect = [
+            (partial, None), asyncio.TimeoutError(),  # attempt 1's window
+            (late, None),                             # backoff window
+        ]
+
+        result = await protocol.request_properties_full(
+            ["power", "volume"], timeout=0.1, retries=1
+        )
+
+        assert result["volume"]["value"] == "-40.0"
+        mock_socket_mgr.send.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_late_ack_during_backoff_is_not_resent(self, mock_socket_mgr):
+        """An ack landing in the backoff completes the command with no second send
+        (a re-sent relative command would be applied twice)."""
+        protocol = Protocol(mock_socket_mgr, ack_timeout=0.5)
+        protocol._base_backoff = 0.05
+        mock_socket_mgr.recv.side_effect = [
+            asyncio.TimeoutError(),                                  # attempt 1's window
+            (b'<?xml version="1.0"?><emotivaAck/>', None),           # backoff window
+        ]
+
+        xml = await protocol.send_command("volume", {"value": "1"})
+
+        assert xml.tag == "emotivaAck"
+        mock_socket_mgr.send.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_late_subscription_confirmation_during_backoff(self, mock_socket_mgr):
+        """A late emotivaSubscription completes subscribe() without a re-send."""
+        protocol = Protocol(mock_socket_mgr, protocol_version="3.1", ack_timeout=0.5)
+        protocol._base_backoff = 0.05
+        confirmation = (
+            b'<?xml version="1.0"?><emotivaSubscription protocol="3.1">'
+            b'<property name="power" value="On" visible="true" status="ack"/>'
+            b'</emotivaSubscription>'
+        )
+        mock_socket_mgr.recv.side_effect = [asyncio.TimeoutError(), (confirmation, None)]
+
+        result = await protocol.subscribe(["power"])
+
+        assert result == {"power": {"value": "On", "visible": True}}
+        mock_socket_mgr.send.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_garbled_frame_during_backoff_falls_back_to_resend(self, mock_socket_mgr):
+        """A frame that fails to parse in the backoff ends the wait; the command is re-sent."""
+        protocol = Protocol(mock_socket_mgr, ack_timeout=0.5)
+        protocol._base_backoff = 0.05
+        mock_socket_mgr.recv.side_effect = [
+            asyncio.TimeoutError(),
+            (b"<emotivaAck", None),
+            (b'<?xml version="1.0"?><emotivaAck/>', None),
+        ]
+
+        xml = await protocol.send_command("power_on")
+
+        assert xml.tag == "emotivaAck"
+        assert mock_socket_mgr.send.await_count == 2
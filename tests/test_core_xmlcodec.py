@@ -128,12 +128,43 @@ def test_build_command_returns_bytes(self):
         result = build_command("power_on")
         assert isinstance(result, bytes)
 
+    def test_build_command_reuses_encoded_payload(self):
+        """A repeated command returns the memoized bytes; attribute values still count."""
+        first = build_command("mute_toggle", ack="no")
+        assert build_command("mute_toggle", ack="no") is first
+        assert build_command("mute_toggle", ack="yes") != first
+        # Values are keyed by their string form, exactly as they are sent
+        assert build_command("set_volume", value=-20.5) == build_command("set_volume", value="-20.5")
+
     def test_build_command_includes_xml_declaration(self):
         """Test that the result includes XML declaration."""
         result = build_command("power_on")
         result_str = result.decode('utf-8')
         assert result_str.startswith('<?xml version="1.0" encoding="utf-8"?>')
 
+    @pytest.mark.parametrize("value", [
+        "0", "-20.5", "+1", "Ñoñó", 'a&b<c>d"e', "line\r\nbreak\ttab", "&amp;", "",
+    ])
+    def test_build_command_matches_elementtree_serialization(self, value):
+        """Directly formatted packets are byte-identical to ElementTree's output."""
+        cmd = ET.Element("emotivaControl")
+        sub = ET.SubElement(cmd, "set_name")
+        sub.set("value", value)
+        sub.set("ack", "no")
+        expected = (b'<?xml version="1.0" encoding="utf-8"?>'
+                    + ET.tostring(cmd, encoding="utf-8", xml_declaration=False))
+
+        result = build_command("set_name", value=value, ack="no")
+
+        assert result == expected
+        assert ET.fromstring(result)[0].get("value") == value
+
+    def test_build_command_encodes_non_ascii_as_utf8(self):
+        """Non-ASCII values are UTF-8 bytes, not character references."""
+        result = build_command("set_name", value="Ñoñó")
+        assert "Ñoñó".encode("utf-8") in result
+        assert result.count(b"<?xml") == 1
+
 
 class TestBuildUpdate:
     """Test cases for build_update function."""
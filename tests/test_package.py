@@ -0,0 +1,49 @@
+"""Test cases for the pymotivaxmc2 package root exports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import pymotivaxmc2
+
+
+class TestPackageExports:
+    """Test cases for the names re-exported from the package root."""
+
+    def test_all_names_resolve(self):
+        """Every name in __all__ is reachable as a package attribute."""
+        for name in pymotivaxmc2.__all__:
+            assert getattr(pymotivaxmc2, name) is not None
+            assert name in dir(pymotivaxmc2)
+
+    def test_controller_export_is_the_controller_class(self):
+        """The lazily-resolved export is the real controller class."""
+        from pymotivaxmc2.controller import EmotivaController
+
+        assert pymotivaxmc2.EmotivaController is EmotivaController
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            pymotivaxmc2.NoSuchThing  # noqa: B018
+
+    def test_import_does_not_load_controller(self):
+        """Importing the package leaves the controller stack unloaded."""
+        code = (
+            "import sys, pymotivaxmc2; "
+            "assert 'pymotivaxmc2.controller' not in sys.modules; "
+            "pymotivaxmc2.EmotivaController; "
+            "assert 'pymotivaxmc2.controller' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_core_import_does_not_load_enums(self):
+        """The transport modules load without the enum catalog."""
+        code = (
+            "import sys, pymotivaxmc2.core.discovery; "
+            "assert 'pymotivaxmc2.enums' not in sys.modules; "
+            "from pymotivaxmc2 import Property; "
+            "assert Property.POWER == 'power'"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)